@@ -13,6 +13,37 @@ if TYPE_CHECKING:
     from ap_games.ap_typing import PlayerMark
     from ap_games.game.game_base import TwoPlayerBoardGame
 
+__all__ = (
+    'BitShift',
+    'Cell',
+    'Config',
+    'Coordinate',
+    'Game',
+    'GameStatus',
+    'Move',
+    'Node',
+    'Offset',
+    'Ray',
+)
+
+
+class BitShift(NamedTuple):
+    """BitShift(step: int, right_mask: int, left_mask: int).
+
+    :ivar step:  The positive difference between indices of neighboring
+        cells in one line of the gameboard.
+    :ivar right_mask:  The bit mask of cells that can be reached by the
+        shift of a bitboard to the right by ``step`` (to the cell with
+        the greater index) without wrapping around the edge.
+    :ivar left_mask:  The same as ``right_mask``, but for the shift to
+        the left (to the cell with the lesser index).
+
+    """
+
+    step: int
+    right_mask: int
+    left_mask: int
+
 
 class Config(TypedDict, total=False):
     """Config(log_level: str, log_file: str, test_mode: bool)."""
@@ -84,3 +115,22 @@ class Offset(NamedTuple):
 
     coordinate: Coordinate
     direction: Coordinate
+
+
+class Ray(NamedTuple):
+    """Ray(start: int, cells: slice, first: int, step: int).
+
+    :ivar start:  The index of the cell from which the ray starts.  This
+        cell isn't included to the ray.
+    :ivar cells:  The slice of the grid string with all cells of the ray
+        from the nearest one to the edge of the gameboard.
+    :ivar first:  The index of the nearest cell of the ray.
+    :ivar step:  The difference between indices of neighboring cells
+        of the ray.
+
+    """
+
+    start: int
+    cells: slice
+    first: int
+    step: int
@@ -13,6 +13,16 @@ if TYPE_CHECKING:
     from ap_games.ap_typing import PlayerMark
     from ap_games.ap_typing import UndefinedMark
 
+__all__ = (
+    'EMPTY',
+    'O_MARK',
+    'UNDEFINED_CELL',
+    'UNDEFINED_COORDINATE',
+    'UNDEFINED_MARK',
+    'UNDEFINED_MOVE',
+    'X_MARK',
+)
+
 EMPTY: Final[Empty] = ' '
 O_MARK: Final[PlayerMark] = 'O'
 X_MARK: Final[PlayerMark] = 'X'
@@ -8,6 +8,19 @@ from ap_games.ap_collections import Cell
 from ap_games.ap_collections import Coordinate
 from ap_games.ap_collections import Node
 
+__all__ = (
+    'Coordinates',
+    'Directions',
+    'Empty',
+    'Mark',
+    'PlayerMark',
+    'PlayerType',
+    'Side',
+    'Size',
+    'Tree',
+    'UndefinedMark',
+)
+
 Mark = Literal['X', 'O', ' ', '']
 Empty = Literal[' ']
 PlayerMark = Literal['X', 'O']
@@ -182,7 +182,7 @@ class TwoPlayerBoardGame:
         gameboard = gameboard or self.gameboard
         player_mark = player_mark or self.players[0].mark
 
-        if self.get_available_moves(gameboard, player_mark):
+        if self.get_available_indices(gameboard, player_mark):
             return GameStatus(active=True, message='', must_skip=False)
         return GameStatus(active=False, message='', must_skip=False)
 
@@ -215,6 +215,61 @@ class TwoPlayerBoardGame:
             return 0
         return gameboard.place_mark(coordinate, player_mark)
 
+    def place_mark_at_index(
+        self,
+        index: int,
+        player_mark: Optional[PlayerMark] = None,
+        gameboard: Optional[SquareGameboard] = None,
+    ) -> int:
+        """Change the mark of the cell with index on the gameboard.
+
+        .. warning::
+
+            Unlike :meth:`.place_mark` this method does not check if
+            the move is available.  The ``index`` must be one of the
+            indices returned by :meth:`.get_available_indices`.
+
+        This method should be overridden by subclasses if there is a
+        more complex rule for marking cell(s) in ``gameboard``.
+
+        :param index: index of cell which player mark.
+        :param player_mark: Optional.  If undefined, use mark of player
+            with index ``0`` in :attr:`.players` (current player mark).
+        :param gameboard: Optional.  If undefined, use
+            :attr:`.TwoPlayerBoardGame.gameboard`.
+
+        :returns: Score as count of marked cells.
+
+        """
+        gameboard = gameboard or self.gameboard
+        player_mark = player_mark or self.players[0].mark
+        return gameboard.place_mark_at_index(index, player_mark)
+
+    def get_available_indices(
+        self,
+        gameboard: Optional[SquareGameboard] = None,
+        player_mark: Optional[PlayerMark] = None,
+    ) -> Tuple[int, ...]:
+        """Return a tuple of indices of all the ``EMPTY`` cells.
+
+        The same as :meth:`.get_available_moves`, but the cells are
+        represented by their indices on the gameboard.
+
+        This method should be overridden by subclasses if there is a
+        more complex rule for determining which cell is available.
+
+        :param gameboard: Optional.  If undefined, use
+            :attr:`.TwoPlayerBoardGame.gameboard`.
+        :param player_mark: Optional.  If undefined, use mark of player
+            with index ``0`` in :attr:`.players` (current player mark).
+
+        :returns: All indices of the cells of the given ``gameboard``
+            where player with the ``player_mark`` can move.
+
+        """
+        gameboard = gameboard or self.gameboard
+        return gameboard.available_indices
+
     def get_available_moves(
         self,
         gameboard: Optional[SquareGameboard] = None,
@@ -366,9 +421,10 @@ class TwoPlayerBoardGame:
 
     def _rotate_players(self) -> None:
         """Move player with the least number of mark to the front of queue."""
-        while self.gameboard.count(
-            self.players[0].mark
-        ) > self.gameboard.count(self.players[1].mark):
+        # there are only two players, so one rotation is always enough
+        if self.gameboard.count(self.players[0].mark) > self.gameboard.count(
+            self.players[1].mark
+        ):
             self.players.rotate(1)
 
     @staticmethod
@@ -11,14 +11,13 @@ from ap_games.log import logger
 
 if TYPE_CHECKING:
     from typing import ClassVar
+    from typing import DefaultDict
     from typing import Dict
     from typing import List
     from typing import Optional
     from typing import Tuple
 
-    from ap_games.ap_collections import Cell
     from ap_games.ap_typing import Coordinates
-    from ap_games.ap_typing import Directions
     from ap_games.ap_typing import PlayerMark
     from ap_games.gameboard.gameboard import SquareGameboard
 
@@ -77,11 +76,11 @@ class Reversi(TwoPlayerBoardGame):
         gameboard = gameboard or self.gameboard
         player_mark = player_mark or self.players[0].mark
 
-        if self.get_available_moves(gameboard, player_mark):
+        enemy_mark: PlayerMark = self.get_enemy_mark(player_mark)
+        if self._has_available_moves(gameboard, player_mark, enemy_mark):
             return GameStatus(active=True, message='', must_skip=False)
 
-        enemy_mark: PlayerMark = self.get_enemy_mark(player_mark)
-        if self.get_available_moves(gameboard, enemy_mark):
+        if self._has_available_moves(gameboard, enemy_mark, player_mark):
             game_status = GameStatus(
                 active=False,
                 message=(
@@ -128,26 +127,56 @@ class Reversi(TwoPlayerBoardGame):
         gameboard = gameboard or self.gameboard
         player_mark = player_mark or self.players[0].mark
 
-        if coordinate not in self.get_available_moves(gameboard, player_mark):
+        available_moves: DefaultDict[
+            Coordinate, List[Coordinate]
+        ] = self._get_available_moves_dict(gameboard, player_mark)
+        if coordinate not in available_moves:
             logger.warning('You cannot go here!')
             return 0
 
         grid: str = gameboard.grid_as_string
-        # the cache was filled in :meth:`.get_available_moves` method.
-        enemy_coordinates: Directions = tuple(
-            self._available_moves_cache[grid, player_mark][coordinate]
+        score: int = self.place_mark_at_index(
+            gameboard.registry.coordinate_to_index[coordinate],
+            player_mark,
+            gameboard,
         )
-        score: int = gameboard.place_mark(coordinate, player_mark)
-
-        for enemy_coordinate in enemy_coordinates:
-            score += gameboard.place_mark(
-                coordinate=enemy_coordinate, mark=player_mark, force=True,
-            )
         if gameboard is self.gameboard:
             # if gameboard is not fake
             del self._available_moves_cache[grid, player_mark]
         return score
 
+    def place_mark_at_index(
+        self,
+        index: int,
+        player_mark: Optional[PlayerMark] = None,
+        gameboard: Optional[SquareGameboard] = None,
+    ) -> int:
+        """Player's move at given index on the gameboard.
+
+        .. seealso::
+
+            :meth:`.TwoPlayerBoardGame.place_mark_at_index`
+
+        :param index: The index of cell where player want to move.
+        :param player_mark: Optional.  If undefined, use mark of current
+            player (mark of the player with index ``0`` in
+            :attr:`.players`).
+        :param gameboard: Optional.  If undefined, use
+            :attr:`.gameboard`.
+
+        :returns: Score as count of marked cells.
+
+        """
+        gameboard = gameboard or self.gameboard
+        player_mark = player_mark or self.players[0].mark
+
+        # the cached flips of the move, so nothing is scanned twice
+        enemy_coordinates: List[Coordinate] = self._get_available_moves_dict(
+            gameboard, player_mark
+        ).get(gameboard.registry.index_to_coordinate[index], [])
+        score: int = gameboard.place_mark_at_index(index, player_mark)
+        return score + gameboard.flip(enemy_coordinates, player_mark)
+
     def get_available_moves(
         self,
         gameboard: Optional[SquareGameboard] = None,
@@ -168,22 +197,37 @@ class Reversi(TwoPlayerBoardGame):
         """
         gameboard = gameboard or self.gameboard
         player_mark = player_mark or self.players[0].mark
+        return tuple(self._get_available_moves_dict(gameboard, player_mark))
 
-        grid: str = gameboard.grid_as_string
+    def get_available_indices(
+        self,
+        gameboard: Optional[SquareGameboard] = None,
+        player_mark: Optional[PlayerMark] = None,
+    ) -> Tuple[int, ...]:
+        """Return a tuple of indices of all the available cells.
 
-        if (grid, player_mark) not in self._available_moves_cache:
-            self._available_moves_cache[grid, player_mark] = defaultdict(list)
-            enemy_mark: PlayerMark = self.get_enemy_mark(player_mark)
-            for cell in filter(
-                lambda x: x.mark != enemy_mark, gameboard.cells
-            ):
-                self._fill_available_moves_cache(
-                    gameboard=gameboard,
-                    start_cell=cell,
-                    player_mark=player_mark,
-                    enemy_mark=enemy_mark,
-                )
-        return tuple(self._available_moves_cache[grid, player_mark])
+        .. seealso::
+
+            :meth:`.get_available_moves`
+
+        :param gameboard: Optional.  If undefined, use
+            :attr:`.gameboard`.
+        :param player_mark: Optional.  If undefined, use mark of player
+            with index ``0`` in :attr:`.players` (current player mark).
+
+        :returns: All indices of the cells of the given ``gameboard``
+            where player with the ``player_mark`` can move.
+
+        """
+        gameboard = gameboard or self.gameboard
+        player_mark = player_mark or self.players[0].mark
+        coordinate_to_index = gameboard.registry.coordinate_to_index
+        return tuple(
+            coordinate_to_index[coordinate]
+            for coordinate in self._get_available_moves_dict(
+                gameboard, player_mark
+            )
+        )
 
     def get_score(
         self, gameboard: SquareGameboard, player_mark: PlayerMark
@@ -223,45 +267,116 @@ class Reversi(TwoPlayerBoardGame):
             return (self.players[1].mark,)
         return (self.players[0].mark, self.players[1].mark)
 
+    def _has_available_moves(
+        self,
+        gameboard: SquareGameboard,
+        player_mark: PlayerMark,
+        enemy_mark: PlayerMark,
+    ) -> bool:
+        """Return ``True`` if the player has at least one available move.
+
+        If available moves aren't in the cache yet, they are not
+        searched cell by cell.  Instead, the cells with ``enemy_mark``
+        next to the cells with ``player_mark`` are filled along every
+        direction with the bitboards of :meth:`.SquareGameboard.get_bitboard`,
+        and a move exists if any filled line is followed by an ``EMPTY``
+        cell.
+
+        :param gameboard: The gameboard that will be checked.
+        :param player_mark: The current player mark.
+        :param enemy_mark: The mark of the enemy.
+
+        """
+        grid: str = gameboard.grid_as_string
+        if (grid, player_mark) in self._available_moves_cache:
+            return bool(self._available_moves_cache[grid, player_mark])
+
+        player_bits: int = gameboard.get_bitboard(player_mark)
+        enemy_bits: int = gameboard.get_bitboard(enemy_mark)
+        empty_bits: int = gameboard.get_bitboard(EMPTY)
+        # the longest line of enemy marks is two cells shorter than side
+        fills: range = range(gameboard.size - 3)
+        for step, right_mask, left_mask in gameboard.registry.bit_shifts:
+            right_enemy_bits: int = enemy_bits & right_mask
+            left_enemy_bits: int = enemy_bits & left_mask
+            right_line: int = (player_bits >> step) & right_enemy_bits
+            left_line: int = (player_bits << step) & left_enemy_bits
+            for _ in fills:
+                right_line |= (right_line >> step) & right_enemy_bits
+                left_line |= (left_line << step) & left_enemy_bits
+            if (
+                (right_line >> step) & right_mask
+                | (left_line << step) & left_mask
+            ) & empty_bits:
+                return True
+        return False
+
+    def _get_available_moves_dict(
+        self, gameboard: SquareGameboard, player_mark: PlayerMark
+    ) -> DefaultDict[Coordinate, List[Coordinate]]:
+        """Return available moves from the cache and fill it if necessary.
+
+        :param gameboard: The gameboard that will be checked.
+        :param player_mark: The current player mark.
+
+        :returns: The dict where the keys are the coordinates of all
+            available moves, and the values are the lists of coordinates
+            of the cells marked by the enemy, which should be marked in
+            the considered move.
+
+        """
+        grid: str = gameboard.grid_as_string
+
+        if (grid, player_mark) not in self._available_moves_cache:
+            self._available_moves_cache[grid, player_mark] = defaultdict(list)
+            self._fill_available_moves_cache(
+                gameboard=gameboard,
+                player_mark=player_mark,
+                enemy_mark=self.get_enemy_mark(player_mark),
+            )
+        return self._available_moves_cache[grid, player_mark]
+
     def _fill_available_moves_cache(
         self,
         gameboard: SquareGameboard,
-        start_cell: Cell,
         player_mark: PlayerMark,
         enemy_mark: PlayerMark,
     ) -> None:
         """Fill cache with available moves.
 
+        Check all rays of the gameboard, where all cells should have
+        ``enemy_mark`` between the start cell of the ray and cell with
+        ``player_mark`` (if the start cell is ``EMPTY``) or ``EMPTY``
+        (if the start cell is marked with ``player_mark``).
+
         :param gameboard:  The gameboard that will be checked.
-        :param start_cell:  The cell relative to which the directions
-            will be checked.
         :param player_mark:  The current player mark.
-        :param enemy_mark:  The mark to which all cells should have in
-            checked directions between ``start_cell.coordinate`` and
-            cell with ``player_mark`` (if ``start_cell.mark=EMPTY``) or
-            ``EMPTY`` (if ``start_cell.mark=player_mark``).
+        :param enemy_mark:  The mark of the enemy.
 
         """
-        for offset_coordinate, direction in gameboard.get_offsets(
-            start_cell.coordinate
-        ):
-            if gameboard[offset_coordinate].mark == enemy_mark:
-                enemy_coordinates: List[Coordinate] = [offset_coordinate]
-                next_cell: Cell = gameboard.get_offset_cell(
-                    coordinate=offset_coordinate, direction=direction,
-                )
-                while next_cell.mark == enemy_mark:
-                    enemy_coordinates.append(next_cell.coordinate)
-                    next_cell = gameboard.get_offset_cell(
-                        coordinate=next_cell.coordinate, direction=direction,
-                    )
-                if next_cell.mark == player_mark and start_cell.mark == EMPTY:
-                    self._available_moves_cache[
-                        (gameboard.grid_as_string, player_mark)
-                    ][start_cell.coordinate].extend(enemy_coordinates)
-                elif (
-                    next_cell.mark == EMPTY and start_cell.mark == player_mark
-                ):
-                    self._available_moves_cache[
-                        (gameboard.grid_as_string, player_mark)
-                    ][next_cell.coordinate].extend(enemy_coordinates)
+        grid: str = gameboard.grid_as_string
+        index_to_coordinate = gameboard.registry.index_to_coordinate
+        get_coordinate = index_to_coordinate.__getitem__
+        available_moves: DefaultDict[
+            Coordinate, List[Coordinate]
+        ] = self._available_moves_cache[grid, player_mark]
+        for ray in gameboard.registry.rays:
+            start_mark: str = grid[ray.start]
+            if start_mark == enemy_mark or grid[ray.first] != enemy_mark:
+                continue
+            marks: str = grid[ray.cells]
+            # the number of enemy marks next to the start cell
+            count: int = len(marks) - len(marks.lstrip(enemy_mark))
+            if count == len(marks):
+                continue
+            end_mark: str = marks[count]
+            end_index: int = ray.first + ray.step * count
+            if end_mark == player_mark and start_mark == EMPTY:
+                move_index: int = ray.start
+            elif end_mark == EMPTY and start_mark == player_mark:
+                move_index = end_index
+            else:
+                continue
+            available_moves[index_to_coordinate[move_index]].extend(
+                map(get_coordinate, range(ray.first, end_index, ray.step))
+            )
@@ -8,6 +8,7 @@ from ap_games.game.game_base import TwoPlayerBoardGame
 if TYPE_CHECKING:
     from typing import Any
     from typing import ClassVar
+    from typing import Dict
     from typing import List
     from typing import Optional
     from typing import Tuple
@@ -25,6 +26,10 @@ class TicTacToe(TwoPlayerBoardGame):
 
         :class:`TwoPlayerBoardGame`
 
+    :ivar _status_cache: Cache with game statuses by the grid of the
+        gameboard, because the status of Tic-Tac-Toe doesn't depend on
+        the current player.
+
     """
 
     rules: ClassVar[str] = ''.join(
@@ -38,6 +43,7 @@ class TicTacToe(TwoPlayerBoardGame):
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
+        self._status_cache: Dict[str, GameStatus] = {}
         self._rotate_players()
 
     def get_status(
@@ -59,6 +65,21 @@ class TicTacToe(TwoPlayerBoardGame):
         """
         gameboard = gameboard or self.gameboard
 
+        grid: str = gameboard.grid_as_string
+        if grid not in self._status_cache:
+            self._status_cache[grid] = self._calculate_status(gameboard)
+        return self._status_cache[grid]
+
+    def _calculate_status(self, gameboard: SquareGameboard) -> GameStatus:
+        """Return game status of the ``gameboard`` without cache.
+
+        :param gameboard: The gameboard relative to which the status
+            will be calculated.
+
+        :returns: Game status as the instance of namedtuple
+            ``GameStatus``.
+
+        """
         game_status: GameStatus = GameStatus(
             active=True, message='', must_skip=False
         )
@@ -76,7 +97,7 @@ class TicTacToe(TwoPlayerBoardGame):
             winners: Tuple[PlayerMark, ...] = self._get_winners(
                 gameboard=gameboard
             )
-            if (not winners) and not self.get_available_moves(gameboard):
+            if (not winners) and not self.get_available_indices(gameboard):
                 game_status = GameStatus(
                     active=False, message='Draw\n', must_skip=False
                 )
@@ -97,9 +118,9 @@ class TicTacToe(TwoPlayerBoardGame):
     ) -> Tuple[PlayerMark, ...]:
         """Return players who draw solid line.
 
-        If all characters on a 'side' are the same and equal to the
-        mark of player from :attr:`.players`, this player is added to
-        the set of winners.
+        If all cells of a 'side' are marked with the mark of player
+        from :attr:`.players`, this player is added to the set of
+        winners.
 
         :param gameboard: The gameboard relative to which the winner(s)
             will be determined.
@@ -110,14 +131,17 @@ class TicTacToe(TwoPlayerBoardGame):
         """
         gameboard = gameboard or self.gameboard
 
+        registry = gameboard.registry
+        lanes: int = registry.side_lanes
+        masks: int = registry.packed_side_masks
+        guards: int = registry.side_lane_guards
         winners: List[PlayerMark] = []
-        all_sides_as_strings: List[str] = [
-            ''.join(cell.mark for cell in side) for side in gameboard.all_sides
-        ]
-        first_player_side: str = self.players[0].mark * gameboard.size
-        second_player_side: str = self.players[1].mark * gameboard.size
-        if first_player_side in all_sides_as_strings:
-            winners.append(self.players[0].mark)
-        if second_player_side in all_sides_as_strings:
-            winners.append(self.players[1].mark)
+        for player in self.players:
+            # all sides are checked at once: the lane of every side gets
+            # the cells of the side that are not marked by the player
+            bitboard: int = gameboard.get_bitboard(player.mark)
+            unmarked: int = ((bitboard * lanes) & masks) ^ masks
+            # and the subtraction clears the guard bit of an empty lane
+            if ((unmarked | guards) - lanes) & guards != guards:
+                winners.append(player.mark)
         return tuple(winners)
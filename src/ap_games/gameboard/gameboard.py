@@ -1,19 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import cached_property
+from functools import lru_cache
+from operator import getitem
 from platform import system
-from typing import cast
 from typing import TYPE_CHECKING
 
+from ap_games.ap_collections import BitShift
 from ap_games.ap_collections import Cell
 from ap_games.ap_collections import Coordinate
 from ap_games.ap_collections import Offset
+from ap_games.ap_collections import Ray
 from ap_games.ap_constants import EMPTY
 from ap_games.ap_constants import O_MARK
 from ap_games.ap_constants import UNDEFINED_CELL
 from ap_games.ap_constants import X_MARK
-from ap_games.ap_typing import Mark
 from ap_games.log import logger
 
 if TYPE_CHECKING:
@@ -22,16 +23,26 @@ if TYPE_CHECKING:
     from typing import Dict
     from typing import Final
     from typing import List
+    from typing import Optional
+    from typing import Sequence
     from typing import Tuple
 
     from ap_games.ap_typing import Coordinates
     from ap_games.ap_typing import Directions
+    from ap_games.ap_typing import Mark
     from ap_games.ap_typing import PlayerMark
     from ap_games.ap_typing import Side
     from ap_games.ap_typing import Size
 
 __all__ = ('SquareGameboard',)
 
+_MARKS: Final[Tuple[Mark, ...]] = (EMPTY, X_MARK, O_MARK)
+_EMPTY_BYTE: Final[int] = ord(EMPTY)
+_BIT_TABLES: Final[Dict[Mark, Dict[int, str]]] = {
+    mark: {ord(other): '1' if other == mark else '0' for other in _MARKS}
+    for mark in _MARKS
+}
+
 
 @dataclass(frozen=True)
 class _Colors:
@@ -43,6 +54,55 @@ class _Colors:
     CYAN: Final[str] = '\033[36m'
 
 
+@lru_cache(maxsize=8192)
+def _get_empty_indices(grid: str) -> Tuple[int, ...]:
+    """Return a tuple of indices of all ``EMPTY`` marks in ``grid``.
+
+    The result is cached by the grid string, so the same position
+    reached again during the search is not scanned twice.
+
+    :param grid: The grid of a gameboard as a string.
+
+    :returns: Indices in the ascending order.
+
+    """
+    return tuple(index for index, mark in enumerate(grid) if mark == EMPTY)
+
+
+@lru_cache(maxsize=8192)
+def _get_bitboard(grid: str, mark: Mark) -> int:
+    """Return the cells of ``grid`` marked with ``mark`` as an integer.
+
+    The cell with index ``i`` is the bit ``1 << (len(grid) - 1 - i)``,
+    so the grid is converted by :meth:`str.translate` and :func:`int`
+    without a loop in Python.
+
+    :param grid: The grid of a gameboard as a string.
+    :param mark: The mark of cells that are set to ``1``.
+
+    """
+    return int(grid.translate(_BIT_TABLES[mark]), 2)
+
+
+@lru_cache(maxsize=8192)
+def _get_empty_coordinates(
+    registry: _GameboardRegistry, grid: str
+) -> Coordinates:
+    """Return a tuple of coordinates of all ``EMPTY`` marks in ``grid``.
+
+    :param registry: The registry of gameboards with the size of
+        ``grid``.
+    :param grid: The grid of a gameboard as a string.
+
+    :returns: Coordinates in the order of :func:`_get_empty_indices`.
+
+    """
+    index_to_coordinate = registry.index_to_coordinate
+    return tuple(
+        index_to_coordinate[index] for index in _get_empty_indices(grid)
+    )
+
+
 class _GameboardRegistry:
     """GameboardRegistry stores basic mapping of SquareGameboard class.
 
@@ -69,9 +129,62 @@ class _GameboardRegistry:
 
             :meth:`._fill_offsets`
 
+    :ivar coordinate_to_index: Store the reverse mapping of
+        :attr:`.index_to_coordinate`.
+
     :ivar all_coordinates: Store all possible coordinates of the
         :class:`SquareGameboard` with the given ``size``.
 
+    :ivar index_to_cells: Store for each cell index the mapping of the
+        byte of every possible mark to the corresponding instance of
+        :class:`Cell`, so gameboards build cells without allocations.
+
+    :ivar rays: Store the rays from all cells in the same directions as
+        :attr:`.offsets`, ordered by the index of the start cell.  Where
+        each ray is an instance of namedtuple :class:`Ray`, so the marks
+        of all its cells are taken from the grid string by one slice.
+
+        .. seealso::
+
+            :meth:`._get_rays`
+
+    :ivar sides: Store indices of cells of all rows, columns and both
+        diagonals in the same order as
+        :attr:`SquareGameboard.all_sides`.
+
+        .. seealso::
+
+            :meth:`._get_sides`
+
+    :ivar side_masks: Store bit masks of all :attr:`.sides`.
+
+        .. seealso::
+
+            :meth:`SquareGameboard.get_bitboard`
+
+    :ivar side_lanes: Store an integer with the lowest bit of every
+        lane set, where each lane is ``size ** 2 + 1`` bits wide and
+        there is one lane per side.  Multiplication of a bitboard by it
+        copies the bitboard to all lanes.
+
+    :ivar packed_side_masks: Store :attr:`.side_masks` packed into the
+        lanes of :attr:`.side_lanes`, one mask per lane.
+
+    :ivar side_lane_guards: Store an integer with the highest (spare)
+        bit of every lane set.
+
+        .. seealso::
+
+            :meth:`.TicTacToe._get_winners`
+
+    :ivar bit_shifts: Store the shifts of bitboards to the neighboring
+        cells in both ways of the same directions as :attr:`.rays`.
+        Where each shift is an instance of namedtuple :class:`BitShift`.
+
+        .. seealso::
+
+            :meth:`._get_bit_shifts`
+
     """
 
     _directions: Final[ClassVar[Directions]] = (
@@ -90,10 +203,37 @@ class _GameboardRegistry:
         self.index_to_coordinate: Dict[int, Coordinate] = {}
         self.offsets: Dict[Coordinate, Tuple[Offset, ...]] = {}
         self._fill_index_to_coordinate()
+        self.coordinate_to_index: Dict[Coordinate, int] = {
+            coordinate: index
+            for index, coordinate in self.index_to_coordinate.items()
+        }
         self.all_coordinates: Final[Coordinates] = tuple(
             self.index_to_coordinate.values()
         )
+        self.index_to_cells: Final[Tuple[Dict[int, Cell], ...]] = tuple(
+            {ord(mark): Cell(coordinate, mark) for mark in _MARKS}
+            for coordinate in self.all_coordinates
+        )
         self._fill_offsets()
+        self.rays: Final[Tuple[Ray, ...]] = tuple(
+            ray
+            for coordinate in self.all_coordinates
+            for ray in self._get_rays(coordinate)
+        )
+        self.sides: Final[Tuple[Tuple[int, ...], ...]] = self._get_sides()
+        self.side_masks: Final[Tuple[int, ...]] = self._get_side_masks()
+        lane_width: int = size ** 2 + 1
+        self.side_lanes: Final[int] = sum(
+            1 << (lane_width * lane) for lane in range(len(self.side_masks))
+        )
+        self.packed_side_masks: Final[int] = sum(
+            mask << (lane_width * lane)
+            for lane, mask in enumerate(self.side_masks)
+        )
+        self.side_lane_guards: Final[int] = self.side_lanes << size ** 2
+        self.bit_shifts: Final[
+            Tuple[BitShift, ...]
+        ] = self._get_bit_shifts()
 
     def _fill_index_to_coordinate(self) -> None:
         """Map index of cell to coordinate of that cell and save it.
@@ -111,15 +251,142 @@ class _GameboardRegistry:
             row: int = self.size - a
             self.index_to_coordinate[index] = Coordinate(column, row)
 
+    def _get_rays(self, coordinate: Coordinate) -> Tuple[Ray, ...]:
+        """Return all not empty rays from the ``coordinate``.
+
+        Where an example of the ray to the right up from the index ``6``
+        for a 3x3 grid (``Ray(start=6, cells=slice(4, 0, -2), first=4,
+        step=-2)``)::
+
+            . . 2
+            . 4 .
+            6 . .
+
+        :param coordinate:  The coordinate of the start of rays.  The
+            start cell itself is not included to rays.
+
+        """
+        size: int = self.size
+        index: int = self.coordinate_to_index[coordinate]
+        rays: List[Ray] = []
+        for shift in self._directions:
+            length: int = 0
+            x: int = coordinate.x + shift.x
+            y: int = coordinate.y + shift.y
+            while 0 < x <= size and 0 < y <= size:
+                length += 1
+                x += shift.x
+                y += shift.y
+            if length:
+                step: int = shift.x - shift.y * size
+                stop: int = index + step * (length + 1)
+                rays.append(
+                    Ray(
+                        start=index,
+                        cells=slice(
+                            index + step, stop if stop >= 0 else None, step
+                        ),
+                        first=index + step,
+                        step=step,
+                    )
+                )
+        return tuple(rays)
+
+    def _get_sides(self) -> Tuple[Tuple[int, ...], ...]:
+        """Return indices of cells of all sides of the gameboard.
+
+        Where an example of the first row and the main diagonal for a
+        3x3 grid::
+
+            0 1 2         . . .         0 . .
+            3 4 5   ==>   . . .   and   . 4 .
+            6 7 8         6 7 8         . . 8
+
+        """
+        size: int = self.size
+        rows: List[range] = [
+            range((size - row) * size, (size - row + 1) * size)
+            for row in range(1, size + 1)
+        ]
+        columns: List[range] = [
+            range(column, size ** 2, size) for column in range(size)
+        ]
+        diagonals: List[range] = [
+            range(0, size ** 2, size + 1),
+            range((size - 1) * size, 0, 1 - size),
+        ]
+        return tuple(tuple(side) for side in rows + columns + diagonals)
+
+    def _get_side_masks(self) -> Tuple[int, ...]:
+        """Return bit masks of all :attr:`.sides` of the gameboard."""
+        last_bit: int = self.size ** 2 - 1
+        return tuple(
+            sum(1 << (last_bit - index) for index in side)
+            for side in self.sides
+        )
+
+    def _get_bit_shifts(self) -> Tuple[BitShift, ...]:
+        """Return shifts of bitboards in all directions of the gameboard.
+
+        The shift to the right by ``step`` moves the bit of every cell
+        to the cell with the index greater by ``step``.  Masks drop the
+        bits that wrap around the left or right edge, where an example
+        of masks for the ``step=1`` and a 3x3 grid::
+
+            . 1 2         0 1 .
+            . 4 5   and   3 4 .
+            . 7 8         6 7 .
+
+        """
+        size: int = self.size
+        last_bit: int = size ** 2 - 1
+        # the column that cannot be reached by the horizontal shift
+        unreachable_columns: Dict[int, Optional[int]] = {
+            -1: size - 1,
+            0: None,
+            1: 0,
+        }
+        column_masks: Dict[int, int] = {
+            x_shift: sum(
+                1 << (last_bit - index)
+                for index in range(size ** 2)
+                if index % size != column
+            )
+            for x_shift, column in unreachable_columns.items()
+        }
+        bit_shifts: List[BitShift] = []
+        for shift in self._directions:
+            step: int = shift.x - shift.y * size
+            # the horizontal shift of the cell with the greater index
+            x_shift: int = shift.x if step > 0 else -shift.x
+            bit_shifts.append(
+                BitShift(
+                    step=abs(step),
+                    right_mask=column_masks[x_shift],
+                    left_mask=column_masks[-x_shift],
+                )
+            )
+        return tuple(bit_shifts)
+
     def _fill_offsets(self) -> None:
-        """Fill up :attr:`.offsets` for all coordinates of gameboard."""
+        """Fill up :attr:`.offsets` for all coordinates of gameboard.
+
+        The neighboring cells are checked by the bounds of the
+        gameboard, and their coordinates are taken from
+        :attr:`.index_to_coordinate`, so all offsets share the same
+        instances of :class:`Coordinate`.
+
+        """
+        size: int = self.size
         for coordinate in self.all_coordinates:
             offsets: List[Offset] = []
             for shift in self._directions:
-                offset_coordinate = Coordinate(
-                    x=coordinate.x + shift.x, y=coordinate.y + shift.y
-                )
-                if offset_coordinate in self.all_coordinates:
+                x: int = coordinate.x + shift.x
+                y: int = coordinate.y + shift.y
+                if 0 < x <= size and 0 < y <= size:
+                    offset_coordinate: Coordinate = self.index_to_coordinate[
+                        (size - y) * size + x - 1
+                    ]
                     offsets.append(
                         Offset(coordinate=offset_coordinate, direction=shift)
                     )
@@ -146,9 +413,11 @@ class SquareGameboard:
         grid when printing the gameboard.
 
     :ivar _size: The size of gameboard from 2 to 9.
-    :ivar _cells_dict: Dict with cells of the gameboard.  Where key is
-        a tuple with ``x`` and ``y`` coordinates of the corresponding
-        cell.  And the value is an instance of :class:`Cell`.
+    :ivar _grid: Marks of all cells of the gameboard as a bytearray,
+        where cells are indexed as in
+        :meth:`._GameboardRegistry._fill_index_to_coordinate`.  The
+        instances of :class:`Cell` are taken from
+        :attr:`._GameboardRegistry.index_to_cells` on demand.
 
     :ivar _colors_dict: Dict with colors of each cell of the gameboard.
         Where key is a tuple with two coordinates of the corresponding
@@ -160,8 +429,27 @@ class SquareGameboard:
 
             This attribute adds 25% processing speed.
 
+    :ivar _cells_cache: Save :attr:`.cells`, so :attr:`.rows`,
+        :attr:`.columns` and :attr:`.diagonals` don't build them again.
+        This cache is cleared in :meth:`.place_mark`.
+
     """
 
+    __slots__ = (
+        'colorized',
+        'indent',
+        'registry',
+        '_size',
+        '_gap',
+        '_axis',
+        '_grid',
+        '_colors_dict',
+        '_grid_cache',
+        '_cells_cache',
+        '_horizontal_border',
+        '_column_axis',
+    )
+
     mark_colors: Final[ClassVar[Dict[Mark, str]]] = {
         X_MARK: _Colors.BLUE,
         O_MARK: _Colors.GREEN,
@@ -207,19 +495,17 @@ class SquareGameboard:
         self._gap: Final[str] = gap
         self._axis: Final[bool] = axis
 
-        self._cells_dict: Dict[Tuple[int, int], Cell] = {}
         self._colors_dict: Dict[Tuple[int, int], str] = {}
-        self._grid_cache: str = ''
+        self._grid_cache: str = grid
+        self._cells_cache: Tuple[Cell, ...] = ()
         if _safety:
-            if not set(grid).issubset(set(self.mark_colors.keys())):
+            if not set(grid) <= self.mark_colors.keys():
                 raise ValueError(
                     'The "grid" must include characters from the set: '
                     f'{set(self.mark_colors.keys())}!'
                 )
-            for index, mark in enumerate(grid):
-                coordinate = self.registry.index_to_coordinate[index]
-                mark = cast(Mark, mark)
-                self._cells_dict[coordinate] = Cell(coordinate, mark)
+        self._grid: bytearray = bytearray(grid, 'ascii')
+        if _safety:
             self._default_paint()
 
         self._horizontal_border: str = (
@@ -260,7 +546,7 @@ class SquareGameboard:
                 for cell in row
             )
             + f'{self._gap}|'
-            for num, row in reversed(tuple(enumerate(self.rows, 1)))
+            for num, row in zip(range(self._size, 0, -1), self.rows[::-1])
         )
 
         return (
@@ -280,9 +566,10 @@ class SquareGameboard:
 
     def __getitem__(self, coordinate: Coordinate) -> Cell:
         """Return Cell by coordinate."""
-        return self._cells_dict[coordinate]
+        index: int = self.registry.coordinate_to_index[coordinate]
+        return self.registry.index_to_cells[index][self._grid[index]]
 
-    @cached_property
+    @property
     def size(self) -> int:
         """Return size of gameboard."""
         return self._size
@@ -300,47 +587,35 @@ class SquareGameboard:
 
         """
         if not self._grid_cache:
-            self._grid_cache = ''.join(
-                cell.mark for cell in self._cells_dict.values()
-            )
+            self._grid_cache = self._grid.decode('ascii')
         return self._grid_cache
 
     @property
     def columns(self) -> Tuple[Side, ...]:
         """Return all columns of gameboard as a tuple."""
+        cells: Tuple[Cell, ...] = self.cells
         return tuple(
-            tuple(
-                filter(
-                    lambda cell: cell.coordinate.x == column,
-                    self._cells_dict.values(),
-                )
-            )
-            for column in range(1, self._size + 1)
+            cells[column :: self._size] for column in range(self._size)
         )
 
     @property
     def rows(self) -> Tuple[Side, ...]:
         """Return all rows of gameboard as a tuple."""
+        cells: Tuple[Cell, ...] = self.cells
+        size: int = self._size
         return tuple(
-            tuple(
-                filter(
-                    lambda cell: cell.coordinate.y == row,
-                    self._cells_dict.values(),
-                )
-            )
-            for row in range(1, self._size + 1)
+            cells[(size - row) * size : (size - row + 1) * size]
+            for row in range(1, size + 1)
         )
 
     @property
     def diagonals(self) -> Tuple[Side, Side]:
         """Return main and reverse diagonals as tuples of cell."""
-        main_diagonal: Side = tuple(
-            self._cells_dict[num, self._size - num + 1]
-            for num in range(1, self._size + 1)
-        )
-        reverse_diagonal: Side = tuple(
-            self._cells_dict[num, num] for num in range(1, self._size + 1)
-        )
+        cells: Tuple[Cell, ...] = self.cells
+        size: int = self._size
+        # from (1, size) to (size, 1) and from (1, 1) to (size, size)
+        main_diagonal: Side = cells[:: size + 1]
+        reverse_diagonal: Side = cells[(size - 1) * size :: 1 - size][:size]
         return main_diagonal, reverse_diagonal
 
     @property
@@ -350,7 +625,10 @@ class SquareGameboard:
         Where each side is a tuple of cells of the corresponding side.
 
         """
-        return self.rows + self.columns + self.diagonals
+        cells: Tuple[Cell, ...] = self.cells
+        return tuple(
+            tuple(map(cells.__getitem__, side)) for side in self.registry.sides
+        )
 
     @property
     def cells(self) -> Tuple[Cell, ...]:
@@ -363,16 +641,27 @@ class SquareGameboard:
         * ``mark`` of cell as a one-character string.
 
         """
-        return tuple(self._cells_dict.values())
+        if not self._cells_cache:
+            self._cells_cache = tuple(
+                map(getitem, self.registry.index_to_cells, self._grid)
+            )
+        return self._cells_cache
+
+    @property
+    def available_indices(self) -> Tuple[int, ...]:
+        """Return a tuple of indices of all ``EMPTY`` cells.
+
+        .. seealso::
+
+            :meth:`._GameboardRegistry._fill_index_to_coordinate`
+
+        """
+        return _get_empty_indices(self.grid_as_string)
 
     @property
     def available_moves(self) -> Coordinates:
         """Return a tuple of coordinates of all ``EMPTY`` cells."""
-        return tuple(
-            cell.coordinate
-            for cell in self._cells_dict.values()
-            if cell.mark == EMPTY
-        )
+        return _get_empty_coordinates(self.registry, self.grid_as_string)
 
     def place_mark(
         self, coordinate: Coordinate, mark: PlayerMark, *, force: bool = False,
@@ -389,11 +678,33 @@ class SquareGameboard:
         :returns:  Count of marked cell with ``mark``.
 
         """
-        if (
-            force
-            or self._cells_dict.get(coordinate, UNDEFINED_CELL).mark == EMPTY
-        ):
-            self._cells_dict[coordinate] = Cell(coordinate, mark)
+        index: int = self.registry.coordinate_to_index.get(coordinate, -1)
+        if index < 0:
+            logger.warning('This cell is occupied! Choose another one!')
+            return 0
+        return self.place_mark_at_index(index, mark, force=force)
+
+    def place_mark_at_index(
+        self, index: int, mark: PlayerMark, *, force: bool = False,
+    ) -> int:
+        """Mark cell of the gameboard with the ``index``.
+
+        .. seealso::
+
+            :meth:`.place_mark`
+
+        :param index:  Index of cell from ``0`` to ``size ** 2 - 1``.
+        :param mark:  New mark.  It will be set if ``force=True`` or
+            cell with ``index`` is **empty** (``EMPTY``).
+        :param force:  ``False`` by default.  If ``True`` it doesn't
+            matter if cell is **empty** or not.
+
+        :returns:  Count of marked cell with ``mark``.
+
+        """
+        if force or self._grid[index] == _EMPTY_BYTE:
+            self._grid[index] = ord(mark)
+            coordinate: Coordinate = self.registry.index_to_coordinate[index]
             if self.colorized:
                 if force:
                     self._colors_dict[coordinate] = _Colors.CYAN
@@ -403,10 +714,54 @@ class SquareGameboard:
                         coordinate
                     ] = f'{_Colors.BOLD}{_Colors.CYAN}'
             self._grid_cache = ''
+            self._cells_cache = ()
             return 1
         logger.warning('This cell is occupied! Choose another one!')
         return 0
 
+    def flip(self, coordinates: Sequence[Coordinate], mark: PlayerMark) -> int:
+        """Mark all cells with ``coordinates`` regardless of their marks.
+
+        The same as :meth:`.place_mark` with ``force=True`` for every
+        coordinate, but in one call.
+
+        :param coordinates:  Positions of cells as instances of
+            namedtuple Coordinate(x, y).
+        :param mark:  New mark.
+
+        :returns:  Count of marked cells.
+
+        """
+        coordinate_to_index = self.registry.coordinate_to_index
+        mark_byte: int = ord(mark)
+        for coordinate in coordinates:
+            self._grid[coordinate_to_index[coordinate]] = mark_byte
+            if self.colorized:
+                self._colors_dict[coordinate] = _Colors.CYAN
+        self._grid_cache = ''
+        self._cells_cache = ()
+        return len(coordinates)
+
+    def restore(self, grid: str) -> None:
+        """Replace marks of all cells with marks from ``grid``.
+
+        The search makes moves on one gameboard and unmakes them by
+        restoring the previous grid, so it doesn't create a gameboard
+        for each move.
+
+        .. warning::
+
+            ``grid`` must have the same size and be valid, it isn't
+            checked.  Colors of cells aren't changed.
+
+        :param grid:  The grid as a string returned by
+            :attr:`.grid_as_string` earlier.
+
+        """
+        self._grid[:] = grid.encode('ascii')
+        self._grid_cache = grid
+        self._cells_cache = ()
+
     def get_offset_cell(
         self, *, coordinate: Coordinate, direction: Coordinate
     ) -> Cell:
@@ -420,10 +775,13 @@ class SquareGameboard:
             exist on the gameboard else ``UNDEFINED_CELL``.
 
         """
-        return self._cells_dict.get(
-            (coordinate.x + direction.x, coordinate.y + direction.y,),
-            UNDEFINED_CELL,
-        )
+        size: int = self._size
+        x: int = coordinate.x + direction.x
+        y: int = coordinate.y + direction.y
+        if 0 < x <= size and 0 < y <= size:
+            index: int = (size - y) * size + x - 1
+            return self.registry.index_to_cells[index][self._grid[index]]
+        return UNDEFINED_CELL
 
     def get_offsets(self, coordinate: Coordinate) -> Tuple[Offset, ...]:
         """Return the offsets of the given coordinate.
@@ -437,9 +795,23 @@ class SquareGameboard:
             namedtuple :class:`Offset`.
 
         """
-        if coordinate not in self.registry.all_coordinates:
+        try:
+            return self.registry.offsets[coordinate]
+        except KeyError:
             raise ValueError(f'The {coordinate} out of range!')
-        return self.registry.offsets[coordinate]
+
+    def get_bitboard(self, mark: Mark) -> int:
+        """Return the cells marked with ``mark`` as bits of an integer.
+
+        :param mark:  The mark relative to which the cell will be
+            matched by.
+
+        :returns:  The integer where the cell with index ``i`` is the
+            bit ``1 << (size ** 2 - 1 - i)``.  It is compatible with
+            :attr:`._GameboardRegistry.side_masks`.
+
+        """
+        return _get_bitboard(self.grid_as_string, mark)
 
     def count(self, mark: str) -> int:
         """Return the number of occurrences of ``mark`` on the gameboard.
@@ -466,12 +838,9 @@ class SquareGameboard:
             _safety=False,
             **kwargs,
         )
-        sg._cells_dict = dict(self._cells_dict)
-        sg._grid_cache = self._grid_cache
         return sg
 
     def _default_paint(self) -> None:
         self._colors_dict = {
-            coordinate: self.mark_colors[self._cells_dict[coordinate].mark]
-            for coordinate in self._cells_dict
+            cell.coordinate: self.mark_colors[cell.mark] for cell in self.cells
         }
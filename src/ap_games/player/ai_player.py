@@ -15,12 +15,16 @@ from ap_games.log import logger
 from ap_games.player.player import Player
 
 if TYPE_CHECKING:
+    from typing import Callable
     from typing import ClassVar
     from typing import Dict
     from typing import Final
+    from typing import Iterable
     from typing import List
     from typing import Optional
+    from typing import Sequence
     from typing import Set
+    from typing import Tuple
 
     from ap_games.ap_collections import GameStatus
     from ap_games.ap_collections import Coordinate
@@ -31,10 +35,118 @@ if TYPE_CHECKING:
 
 __all__ = ('AIPlayer',)
 
+_INFINITY: Final[float] = float('inf')
+
+
+class _Window:
+    """The alpha-beta window of a node of the minimax tree.
+
+    ``alpha`` is the score that ``self`` is already assured of and
+    ``beta`` is the score that the enemy is already assured of.  Scores
+    are compared strictly, so moves with the same score as the best one
+    aren't cut off.  The score of a cut off move is only a bound and its
+    ``potential`` is ``0``, so only moves tying the best score keep the
+    exact ``potential``.
+
+    :param alpha:  The lower bound of the score of the node.
+    :param beta:  The upper bound of the score of the node.
+    :param maximize:  ``True`` if ``self`` moves in the node.
+    :param priority_coordinates:  Bonuses of the coordinates that will
+        be applied to the scores of moves.
+
+    """
+
+    __slots__ = ('alpha', 'beta', 'maximize', 'priority_coordinates')
+
+    def __init__(
+        self,
+        alpha: float,
+        beta: float,
+        *,
+        maximize: bool,
+        priority_coordinates: Dict[Coordinate, int],
+    ) -> None:
+        self.alpha: float = alpha
+        self.beta: float = beta
+        self.maximize: Final[bool] = maximize
+        self.priority_coordinates: Final[
+            Dict[Coordinate, int]
+        ] = priority_coordinates
+
+    def get_bounds(self, coordinate: Coordinate) -> Tuple[float, float]:
+        """Return the window of the child node reached by ``coordinate``.
+
+        The child doesn't know about the bonus of ``coordinate``, so the
+        bounds are shifted by it.
+
+        :param coordinate:  The coordinate of the move to the child.
+
+        :returns:  ``alpha`` and ``beta`` of the child node.
+
+        """
+        bonus: int = self._get_bonus(coordinate)
+        return self.alpha - bonus, self.beta - bonus
+
+    def cut_off(self, move: Move) -> Optional[Move]:
+        """Narrow the window by the score of the evaluated ``move``.
+
+        :param move:  The move to the child node with its score.
+
+        :returns:  ``None`` if other moves have to be evaluated,
+            otherwise the move with the bound of the score of the node.
+            The enemy already has a better choice than this node.
+
+        """
+        score: int = self.get_score(move)
+        if self.maximize:
+            if score > self.beta:
+                return Move(UNDEFINED_COORDINATE, score, 0, False)
+            self.alpha = max(self.alpha, score)
+        elif score < self.alpha:
+            return Move(UNDEFINED_COORDINATE, score, 0, False)
+        else:
+            self.beta = min(self.beta, score)
+        return None
+
+    def get_score(self, move: Move) -> int:
+        """Return the score of ``move`` with the bonus of its coordinate.
+
+        :param move:  The move to the child node with its score.
+
+        """
+        return move.score + self._get_bonus(move.coordinate)
+
+    def sort(
+        self, nodes: Iterable[Tuple[str, Node]]
+    ) -> List[Tuple[str, Node]]:
+        """Return cached ``nodes`` sorted from the best move to the worst.
+
+        :param nodes:  Pairs of a grid and a node cached by the previous
+            search.
+
+        """
+        return sorted(
+            nodes,
+            key=lambda grid_and_node: self.get_score(grid_and_node[1].move),
+            reverse=self.maximize,
+        )
+
+    def _get_bonus(self, coordinate: Coordinate) -> int:
+        bonus: int = self.priority_coordinates.get(coordinate, 0)
+        return bonus if self.maximize else -bonus
+
 
 class AIPlayer(Player):
     """AIPlayer in a board game."""
 
+    __slots__ = (
+        'max_depth',
+        'tree',
+        '_select_coordinate',
+        '_transpositions',
+        '_killer_moves',
+    )
+
     _max_depth: ClassVar[Dict[PlayerType, int]] = {
         'easy': 0,
         'medium': 2,
@@ -53,6 +165,21 @@ class AIPlayer(Player):
         super().__init__(type_, mark=mark, game=game)
         self.max_depth: Final[int] = self._max_depth[type_]
         self.tree: Tree = {}
+        # moves of the current search and their expanded subtrees by the
+        # grid, the mark of the player who moves, the depth and the
+        # alpha-beta window of the search
+        self._transpositions: Dict[
+            Tuple[str, PlayerMark, int, float, float], Tuple[Move, Tree]
+        ] = {}
+        # the last move that cut off a node of the current search by the
+        # depth of the node
+        self._killer_moves: Dict[int, Coordinate] = {}
+        # ``max_depth`` doesn't change, so choose the strategy only once
+        self._select_coordinate: Final[Callable[[], Coordinate]] = (
+            self._minimax_coordinate
+            if self.max_depth
+            else self._random_coordinate
+        )
 
     def move(self) -> Coordinate:
         """Define coordinate of the next move and return it.
@@ -62,10 +189,11 @@ class AIPlayer(Player):
 
         """
         logger.info(f'Making move level "{self.type_}" [{self.mark}]')
+        return self._select_coordinate()
 
-        if self.max_depth:
-            return self._minimax().coordinate
-        return self._random_coordinate()
+    def _minimax_coordinate(self) -> Coordinate:
+        """Return coordinate of the move selected by :meth:`._minimax`."""
+        return self._minimax().coordinate
 
     def _minimax(  # noqa: C901
         self,
@@ -73,6 +201,8 @@ class AIPlayer(Player):
         player_mark: Optional[PlayerMark] = None,
         depth: int = 0,
         tree: Optional[Tree] = None,
+        alpha: float = -_INFINITY,
+        beta: float = _INFINITY,
     ) -> Move:
         """Return the move selected by the minimax algorithm.
 
@@ -86,13 +216,14 @@ class AIPlayer(Player):
                (:meth:`._go_through_subtree`). See docstrings
                corresponding method for details;
             3. Call the :meth:`._minimax` method on each available move
-               (recursion) (:meth:`._get_terminal_score`);
+               (recursion) (:meth:`._get_terminal_score`) until the
+               score is out of the alpha-beta window (see
+               :class:`_Window`);
             4. Evaluate returning values from minimax-method calls
                (:meth:`._choose_best_move`).  See next methods for
                details:
 
                * :meth:`._correct_priority_coordinates`;
-               * :meth:`._extract_desired_moves`;
                * :meth:`._extract_most_likely_moves`.
 
             5. Return the best ``Move``.
@@ -114,6 +245,11 @@ class AIPlayer(Player):
 
                 :class:`Node`.
 
+        :param alpha:  Optional.  The score that ``self`` is already
+            assured of.  Minus infinity by default.
+        :param beta:  Optional.  The score that the enemy is already
+            assured of.  Infinity by default.
+
         ``Potential``::
 
             .. note::
@@ -184,11 +320,15 @@ class AIPlayer(Player):
                 :class:`Move`.
 
         """
-        gameboard = gameboard or self.game.gameboard
+        # the search makes and unmakes moves on its own gameboard
+        gameboard = gameboard or self.game.gameboard.copy()
         player_mark = player_mark or self.mark
         if tree is None:
             self._unpack_tree()
             tree = self.tree
+            # scores depend on the depth relative to the current root
+            self._transpositions.clear()
+            self._killer_moves.clear()
 
         node: Node = tree.setdefault(
             gameboard.grid_as_string,
@@ -208,7 +348,10 @@ class AIPlayer(Player):
             if depth < self.max_depth:
                 if node.sub_tree:
                     return self._go_through_subtree(
-                        depth=depth + 1, tree=node.sub_tree,
+                        depth=depth + 1,
+                        tree=node.sub_tree,
+                        alpha=alpha,
+                        beta=beta,
                     )
                 else:  # node.sub_tree == {}
                     return self._go_through_available_moves(
@@ -216,6 +359,8 @@ class AIPlayer(Player):
                         player_mark=player_mark,
                         depth=depth + 1,
                         tree=node.sub_tree,
+                        alpha=alpha,
+                        beta=beta,
                     )
         else:
             # 10 >= max possible self.game.gameboard.size
@@ -238,11 +383,14 @@ class AIPlayer(Player):
         player_mark: PlayerMark,
         depth: int,
         tree: Tree,
+        alpha: float,
+        beta: float,
     ) -> Move:
         """Call minimax method on each available move.
 
         :param gameboard:  The gameboard relative to which the terminal
-            score of the game will be calculated.
+            score of the game will be calculated.  Each move is made on
+            it and unmade after the evaluation.
         :param player_mark:  The mark of player relative to whom the
             terminal score of the game will be calculated.
         :param depth:  The current depth of tree.
@@ -252,30 +400,68 @@ class AIPlayer(Player):
 
                 ``tree`` is always an empty dict.
 
+        :param alpha:  The score that ``self`` is already assured of.
+        :param beta:  The score that the enemy is already assured of.
+
         :returns:  The move selected by the minimax algorithm as
             instance of namedtuple :class:`Move`.
 
         """
         moves: List[Move] = []
-        for coordinate in self.game.get_available_moves(
+        index_to_coordinate = gameboard.registry.index_to_coordinate
+        priority_coordinates = self.game.priority_coordinates
+        window: _Window = _Window(
+            alpha,
+            beta,
+            maximize=player_mark == self.mark,
+            priority_coordinates=priority_coordinates,
+        )
+        indices: Sequence[int] = self.game.get_available_indices(
             gameboard, player_mark
-        ):
-            fake_gameboard: SquareGameboard = gameboard.copy(
-                indent='\t' * depth
-            )
-            self.game.place_mark(coordinate, player_mark, fake_gameboard)
+        )
+        killer_move: Coordinate = self._killer_moves.get(
+            depth, UNDEFINED_COORDINATE
+        )
+        # there is no cached scores yet, so try first the move that cut
+        # off the last node at the same depth (killer move) and moves to
+        # priority coordinates, they are usually the best ones
+        indices = sorted(
+            indices,
+            key=lambda index: (
+                index_to_coordinate[index] != killer_move,
+                -priority_coordinates.get(index_to_coordinate[index], 0),
+            ),
+        )
+        grid: str = gameboard.grid_as_string
+        for index in indices:
+            coordinate: Coordinate = index_to_coordinate[index]
+            self.game.place_mark_at_index(index, player_mark, gameboard)
 
+            child_alpha, child_beta = window.get_bounds(coordinate)
             move: Move = self._get_terminal_score(
                 coordinate=coordinate,
                 player_mark=player_mark,
-                gameboard=fake_gameboard,
+                gameboard=gameboard,
                 depth=depth,
                 tree=tree,
+                alpha=child_alpha,
+                beta=child_beta,
             )
+            # unmake the move, so all moves share the same gameboard
+            gameboard.restore(grid)
+            cutoff_move: Optional[Move] = window.cut_off(move)
+            if cutoff_move:
+                self._killer_moves[depth] = coordinate
+                # the rest of moves wasn't cached, so the node must be
+                # expanded again next time
+                tree.clear()
+                return cutoff_move
             moves.append(move)
         return self._choose_best_move(moves, player_mark, depth)
 
-    def _go_through_subtree(self, depth: int, tree: Tree) -> Move:
+    def _go_through_subtree(
+        self, depth: int, tree: Tree, alpha: float, beta: float,
+    ) -> Move:
         """Call minimax method on each node of tree.
 
         :param depth:  The current depth of tree.
@@ -283,6 +469,9 @@ class AIPlayer(Player):
 
             .. warning::  ``tree`` is always not empty dict.
 
+        :param alpha:  The score that ``self`` is already assured of.
+        :param beta:  The score that the enemy is already assured of.
+
         :raises ValueError: When there are nodes in the same level with
             different ``player_mark``.
 
@@ -290,50 +479,96 @@ class AIPlayer(Player):
             instance of namedtuple :class:`Move`.
 
         """
-        player_marks: Set[PlayerMark] = set()
-        moves: List[Move] = []
-        for grid, node in tree.items():
-            if node.move.last:
-                moves.append(node.move)
-            else:
-                coordinate: Coordinate = node.move.coordinate
-                player_mark: PlayerMark = node.player_mark
-                indent: str = '\t' * depth
-                if node.sub_tree:
-                    if logger.level == logging.DEBUG:
-                        logger.debug(f'\n{indent}[{player_mark}] {coordinate}')
-                        logger.debug(f'{indent}[{grid}]')
-                    move: Move = self._go_through_subtree(
-                        depth=depth + 1, tree=node.sub_tree
-                    )
-                    move = move._replace(coordinate=coordinate)
-                    tree[grid] = Node(
-                        player_mark=player_mark,
-                        move=move,
-                        sub_tree=node.sub_tree,
-                    )
-                    moves.append(move)
-                else:  # node.sub_tree == {}:
-                    # don't compare ``depth`` and ``max_depth``, because
-                    # ``max_depth`` doesn't change during game.
-                    # Therefore cached ``tree`` will never be deeper
-                    # than ``max_depth``.
-                    fake_gameboard: SquareGameboard = SquareGameboard(
-                        grid=grid, indent=indent, colorized=False,
-                    )
-
-                    move = self._get_terminal_score(
-                        coordinate=coordinate,
-                        player_mark=player_mark,
-                        gameboard=fake_gameboard,
-                        depth=depth,
-                        tree=tree,
-                    )
-                    moves.append(move)
-            player_marks.add(node.player_mark)
+        player_marks: Set[PlayerMark] = {
+            node.player_mark for node in tree.values()
+        }
         if len(player_marks) > 1:
             raise ValueError("Impossible!")
-        return self._choose_best_move(moves, player_marks.pop(), depth)
+        player_mark: PlayerMark = player_marks.pop()
+        moves: List[Move] = []
+        window: _Window = _Window(
+            alpha,
+            beta,
+            maximize=player_mark == self.mark,
+            priority_coordinates=self.game.priority_coordinates,
+        )
+        # the tree was cached by the search of the previous move, so its
+        # scores are the principal variation of a shallower search.  The
+        # best moves are evaluated first and the rest are cut off sooner
+        for grid, node in window.sort(tree.items()):
+            move: Move = node.move
+            if not move.last:
+                move = self._go_through_node(
+                    grid, node, depth=depth, tree=tree, window=window
+                )
+            cutoff_move: Optional[Move] = window.cut_off(move)
+            if cutoff_move:
+                # unlike ``_go_through_available_moves``, all moves are
+                # already cached, so ``tree`` stays complete
+                return cutoff_move
+            moves.append(move)
+        return self._choose_best_move(moves, player_mark, depth)
+
+    def _go_through_node(
+        self, grid: str, node: Node, depth: int, tree: Tree, window: _Window,
+    ) -> Move:
+        """Call minimax method on the cached ``node`` of ``tree``.
+
+        :param grid:  The grid of the gameboard of ``node``.
+        :param node:  The cached node whose move isn't the last one.
+        :param depth:  The current depth of tree.
+        :param tree:  The tree of cached moves with ``node``.
+        :param window:  The alpha-beta window of the parent node.
+
+        :returns:  The move to ``node`` with its new score.
+
+        """
+        coordinate: Coordinate = node.move.coordinate
+        player_mark: PlayerMark = node.player_mark
+        indent: str = '\t' * depth
+        alpha, beta = window.get_bounds(coordinate)
+        if not node.sub_tree:
+            # don't compare ``depth`` and ``max_depth``, because
+            # ``max_depth`` doesn't change during game.  Therefore
+            # cached ``tree`` will never be deeper than ``max_depth``.
+            # The empty subtree may be shared by the nodes of the same
+            # grid, so the node gets its own one to expand
+            tree[grid] = Node(
+                player_mark=player_mark, move=node.move, sub_tree={},
+            )
+            fake_gameboard: SquareGameboard = SquareGameboard(
+                grid=grid, indent=indent, colorized=False,
+            )
+            return self._get_terminal_score(
+                coordinate=coordinate,
+                player_mark=player_mark,
+                gameboard=fake_gameboard,
+                depth=depth,
+                tree=tree,
+                alpha=alpha,
+                beta=beta,
+            )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'\n{indent}[{player_mark}] {coordinate}')
+            logger.debug(f'{indent}[{grid}]')
+        # the subtree may be shared by the nodes of the same grid, so
+        # update its copy
+        sub_tree: Tree = node.sub_tree.copy()
+        move: Move = self._go_through_subtree(
+            depth=depth + 1, tree=sub_tree, alpha=alpha, beta=beta,
+        )
+        # a score out of the window is only a bound of the real score
+        move = Move(
+            coordinate,
+            move.score,
+            move.potential,
+            move.last and alpha <= move.score <= beta,
+        )
+        tree[grid] = Node(
+            player_mark=player_mark, move=move, sub_tree=sub_tree,
+        )
+        return move
 
     def _get_terminal_score(
         self,
@@ -342,22 +577,56 @@ class AIPlayer(Player):
         gameboard: SquareGameboard,
         depth: int,
         tree: Tree,
+        alpha: float,
+        beta: float,
     ) -> Move:
-        if logger.level == logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             indent: str = '\t' * depth
+            gameboard.indent = indent
             logger.debug(f'\n{indent}[{player_mark}] {coordinate}')
             logger.debug(gameboard)
 
+        grid: str = gameboard.grid_as_string
         next_player_mark: PlayerMark = self.game.get_enemy_mark(player_mark)
-        move: Move = self._minimax(
-            gameboard=gameboard,
-            player_mark=next_player_mark,
-            depth=depth,
-            tree=tree,
+        # the same grid is often reached by different orders of moves.
+        # Only the search of the same window gives exactly the same move
+        # and cut offs, so it's part of the key.  Nodes cached by the
+        # previous move go through their subtree
+        key: Tuple[str, PlayerMark, int, float, float] = (
+            grid,
+            next_player_mark,
+            depth,
+            alpha,
+            beta,
+        )
+        cached: bool = grid in tree and bool(tree[grid].sub_tree)
+        transposition: Optional[Tuple[Move, Tree]] = (
+            None if cached else self._transpositions.get(key)
+        )
+        if transposition:
+            # share the expanded subtree, so the next move still finds it
+            move, sub_tree = transposition
+        else:
+            move = self._minimax(
+                gameboard=gameboard,
+                player_mark=next_player_mark,
+                depth=depth,
+                tree=tree,
+                alpha=alpha,
+                beta=beta,
+            )
+            sub_tree = tree[grid].sub_tree
+            if not cached:
+                self._transpositions[key] = (move, sub_tree)
+        # a direct call is much cheaper than ``move._replace(...)``.  The
+        # score of the terminal state is exact, but a score out of the
+        # window of the expanded node is only a bound of the real score
+        move = Move(
+            coordinate,
+            move.score,
+            move.potential,
+            move.last and (not sub_tree or alpha <= move.score <= beta),
         )
-        grid: str = gameboard.grid_as_string
-        move = move._replace(coordinate=coordinate)
-        sub_tree: Tree = tree[grid].sub_tree
         tree[grid] = Node(
             player_mark=player_mark, move=move, sub_tree=sub_tree
         )
@@ -376,9 +645,9 @@ class AIPlayer(Player):
     def _choose_best_move(
         self, moves: List[Move], player_mark: PlayerMark, depth: int,
     ) -> Move:
-        indent: str = '\t' * depth
-
-        if logger.level == logging.DEBUG:
+        debug: bool = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            indent: str = '\t' * depth
             logger.debug(
                 f'{indent}Choose the best move from moves -> ' f'{str(moves)}'
             )
@@ -387,21 +656,28 @@ class AIPlayer(Player):
             moves=moves, player_mark=player_mark, depth=depth
         )
 
-        desired_moves: List[Move] = self._extract_desired_moves(
-            moves=corrected_moves, player_mark=player_mark, depth=depth
-        )
-
-        most_likely_moves: List[Move] = self._extract_most_likely_moves(
-            moves=desired_moves, player_mark=player_mark, depth=depth
+        most_likely_moves, desired_count = self._extract_most_likely_moves(
+            moves=corrected_moves, player_mark=player_mark
         )
+        if debug:
+            logger.debug(
+                f'{indent}Most likely moves of {desired_count} desired '
+                f'moves -> {most_likely_moves}'
+            )
 
-        move: Move = random.choice(most_likely_moves)
+        # the same as ``random.choice``, but without its extra checks
+        move: Move = most_likely_moves[
+            int(random.random() * len(most_likely_moves))
+        ]
         # compute and replace ``potential`` in the selected move
-        move = move._replace(
-            potential=move.potential * len(desired_moves) // len(moves)
+        move = Move(
+            coordinate=move.coordinate,
+            score=move.score,
+            potential=move.potential * desired_count // len(moves),
+            last=move.last,
         )
 
-        if logger.level == logging.DEBUG:
+        if debug:
             logger.debug(f'{indent}Selected move: {move}')
 
         return move
@@ -439,86 +715,58 @@ class AIPlayer(Player):
         for move in moves:
             if move.coordinate in self.game.priority_coordinates:
                 corrected_moves.append(
-                    move._replace(
+                    Move(
+                        coordinate=move.coordinate,
                         score=op(
                             move.score,
                             self.game.priority_coordinates[move.coordinate],
-                        )
+                        ),
+                        potential=move.potential,
+                        last=move.last,
                     )
                 )
             else:
                 corrected_moves.append(move)
         return corrected_moves
 
-    def _extract_desired_moves(
-        self, moves: List[Move], player_mark: PlayerMark, depth: int
-    ) -> List[Move]:
-        """Calculate min-max score and returning moves with that score.
-
-        Maximize score of self own move or minimize score of enemy
-        moves.
-
-        :param moves:  Possible moves that should be checked.
-        :param player_mark:  The mark of player who moves.
-        :param depth:  Current depth of tree.
-
-        :return:  A new list of moves that is a subset of the input
-            moves.
-
-        """
-        if player_mark == self.mark:
-            score_func = max
-        else:
-            score_func = min
-
-        desired_score: int = score_func(move.score for move in moves)
-        desired_moves: List[Move] = [
-            move for move in moves if move.score == desired_score
-        ]
-        if logger.level == logging.DEBUG:
-            indent: str = '\t' * depth
-            logger.debug(
-                f'{indent}Desired score moves ({score_func}) -> '
-                f'{desired_moves}'
-            )
-        return desired_moves
-
     def _extract_most_likely_moves(
-        self, moves: List[Move], player_mark: PlayerMark, depth: int
-    ) -> List[Move]:
-        """Maximize probability of self own winning or enemy losing.
+        self, moves: List[Move], player_mark: PlayerMark
+    ) -> Tuple[List[Move], int]:
+        """Return moves with the best score and the best potential.
 
-        .. warning::
-
-            All input moves on this stage must have the same score.
+        Maximize score of self own move or minimize score of enemy
+        moves.  Among moves with that (desired) score maximize
+        probability of self own winning or enemy losing.  Both are
+        computed in one pass over ``moves``.
 
-        :param depth:  Current depth of tree.
         :param moves:  Possible moves that should be checked.
         :param player_mark:  The mark of player who moves and relative
-            to which ``potential_func`` will be determined.
+            to which the best score and potential will be determined.
 
         :return:  A new list of moves that is a subset of the input
-            moves.
+            moves and the number of moves with the desired score.
 
         """
+        maximize: bool = player_mark == self.mark
         desired_score: int = moves[0].score
-
-        if (desired_score > 0 and player_mark == self.mark) or (
-            desired_score <= 0 and player_mark != self.mark
-        ):
-            potential_func = max
-        else:
-            potential_func = min
-        desired_potential: int = potential_func(
-            move.potential for move in moves
-        )
-        most_likely_moves: List[Move] = [
-            move for move in moves if move.potential == desired_potential
-        ]
-        if logger.level == logging.DEBUG:
-            indent: str = '\t' * depth
-            logger.debug(
-                f'{indent}Desired potential moves ({potential_func}) -> '
-                f'{str(most_likely_moves)}'
-            )
-        return most_likely_moves
+        desired_count: int = 0
+        desired_potential: int = 0
+        most_likely_moves: List[Move] = []
+        for move in moves:
+            if move.score == desired_score:
+                desired_count += 1
+            elif (move.score > desired_score) is maximize:
+                desired_score = move.score
+                desired_count = 1
+                most_likely_moves = []
+            else:
+                continue
+            if not most_likely_moves or move.potential == desired_potential:
+                desired_potential = move.potential
+                most_likely_moves.append(move)
+            elif (move.potential > desired_potential) is (
+                (desired_score > 0) is maximize
+            ):
+                desired_potential = move.potential
+                most_likely_moves = [move]
+        return most_likely_moves, desired_count
@@ -17,6 +17,8 @@ __all__ = ('HumanPlayer',)
 class HumanPlayer(Player):
     """HumanPlayer in a game with interaction through the CLI."""
 
+    __slots__ = ()
+
     def move(self) -> Coordinate:
         """Read coordinate of the next move from the input and return it.
 
@@ -24,7 +26,7 @@ class HumanPlayer(Player):
             incorrect.
 
         """
-        logger.info(f'Enter the coordinate [{self._mark}]: ')
+        logger.info(f'Enter the coordinate [{self.mark}]: ')
         input_list: List[str] = sys.stdin.readline().strip().split()
         logger.debug(f'{input_list=}')
         if len(input_list) >= 2:
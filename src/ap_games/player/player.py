@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from functools import cached_property
 import random
 from typing import TYPE_CHECKING
 
 from ap_games.ap_constants import UNDEFINED_COORDINATE
 
 if TYPE_CHECKING:
+    from typing import Callable
     from typing import Tuple
 
     from ap_games.ap_collections import Coordinate
@@ -18,7 +18,15 @@ __all__ = ('Player',)
 
 
 class Player:
-    """Class introduces the player in a board game."""
+    """Class introduces the player in a board game.
+
+    :ivar type_: The type of the player.
+    :ivar mark: The mark of the player.
+    :ivar game: The game as instance of :class:`TwoPlayerBoardGame`.
+
+    """
+
+    __slots__ = ('type_', 'game', 'mark', '_get_available_moves')
 
     def __init__(
         self,
@@ -28,35 +36,24 @@ class Player:
         mark: PlayerMark,
         game: TwoPlayerBoardGame,
     ):
-        self._type: PlayerType = type_
-        self._game: TwoPlayerBoardGame = game
-        self._mark: PlayerMark = mark
+        self.type_: PlayerType = type_
+        self.game: TwoPlayerBoardGame = game
+        self.mark: PlayerMark = mark
+        # bound once to skip the attribute lookups on each move
+        self._get_available_moves: Callable[
+            [], Tuple[Coordinate, ...]
+        ] = game.get_available_moves
 
     def __str__(self) -> str:
         """Return mark."""
-        return self._mark
+        return self.mark
 
     def __repr__(self) -> str:
         return (
-            f"{self.__class__.__name__}('{self._type}', mark='{self._mark}', "
-            f"game={repr(self._game)})"
+            f"{self.__class__.__name__}('{self.type_}', mark='{self.mark}', "
+            f"game={repr(self.game)})"
         )
 
-    @cached_property
-    def type_(self) -> str:
-        """Return type ot the player."""
-        return self._type
-
-    @cached_property
-    def game(self) -> TwoPlayerBoardGame:
-        """Return game as instance of :class:`TwoPlayerBoardGame`."""
-        return self._game
-
-    @cached_property
-    def mark(self) -> PlayerMark:
-        """Return mark of the player."""
-        return self._mark
-
     def move(self) -> Coordinate:
         """Return the randomly selected coordinate.
 
@@ -77,11 +74,11 @@ class Player:
             available coordinates, else ``undefined_coordinate``.
 
         """
-        available_moves: Tuple[
-            Coordinate, ...
-        ] = self.game.get_available_moves()
-        return (
-            random.choice(available_moves)
-            if available_moves
-            else UNDEFINED_COORDINATE
-        )
+        available_moves: Tuple[Coordinate, ...] = self._get_available_moves()
+        # the same as ``random.choice``, but without its extra checks.
+        # ``play`` asks to move only while the game is active, so the
+        # ``IndexError`` of an empty tuple is the rare case
+        try:
+            return available_moves[int(random.random() * len(available_moves))]
+        except IndexError:
+            return UNDEFINED_COORDINATE
@@ -1,25 +1,55 @@
 from __future__ import annotations
 
-from configparser import ConfigParser
 import os
 from pathlib import Path
+import re
+import threading
 from typing import final
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Any
+    from typing import Dict
+    from typing import List
     from typing import Optional
 
     from ap_games.ap_collections import Config
 
 __all__ = ('Settings',)
 
+_BASE_DIR: Path = Path(__file__).parent.resolve(strict=True)
+_LOCK: threading.Lock = threading.Lock()
+_SECTION_RE = re.compile(r'\[(.+)\]')
+_KV_RE = re.compile(r'([^=:]+)[=:](.*)')
+_DEFAULT_SECTION: str = 'DEFAULT'
+_BOOLEAN_STATES: Dict[str, bool] = {
+    '1': True,
+    'yes': True,
+    'true': True,
+    'on': True,
+    '0': False,
+    'no': False,
+    'false': False,
+    'off': False,
+}
+
 
 @final
 class Settings:
-    """Class introduces the settings of the `ap_games` module."""
+    """Class introduces the settings of the `ap_games` module.
+
+    The class is a singleton.  Every call returns the same instance, but
+    only the first one reads `config.ini` and applies the arguments.  A
+    later call may omit the arguments, but can't change them.
+
+    :raises ValueError: if a later call passes arguments that differ
+        from the arguments of the first call.
+
+    """
 
     _singleton: Optional[Settings] = None
+    _initialized: bool = False
+    _arguments: Dict[str, Any]
 
     def __new__(cls, **kwargs: Any) -> Any:
         """Return one "single" instance of current class.
@@ -27,8 +57,10 @@ class Settings:
         :param kwargs: constructor arguments.
 
         """
-        if not cls._singleton:
-            cls._singleton = super().__new__(cls)
+        if cls._singleton is None:
+            with _LOCK:
+                if cls._singleton is None:
+                    cls._singleton = super().__new__(cls)
         return cls._singleton
 
     def __init__(
@@ -39,7 +71,60 @@ class Settings:
         log_level: str = '',
         test_mode: Optional[bool] = None,
     ) -> None:
-        self.base_dir: Path = Path(__file__).parent.resolve(strict=True)
+        arguments: Dict[str, Any] = {
+            'config_file': config_file,
+            'log_file': log_file,
+            'log_level': log_level,
+            'test_mode': test_mode,
+        }
+        # ``__init__`` is called after every ``__new__``, but the single
+        # instance has to read ``config.ini`` only once
+        if not self._initialized:
+            with _LOCK:
+                if not self._initialized:
+                    self._configure(**arguments)
+                    self._arguments = arguments
+                    self._initialized = True
+                    return
+        self._check_arguments(arguments)
+
+    def _check_arguments(self, arguments: Dict[str, Any]) -> None:
+        """Check that ``arguments`` don't change the settings.
+
+        :param arguments: constructor arguments of a later call.
+
+        :raises ValueError: if ``arguments`` that aren't omitted differ
+            from the arguments of the first call.
+
+        """
+        changed_names: List[str] = [
+            name
+            for name, value in arguments.items()
+            if value not in ('', None) and value != self._arguments[name]
+        ]
+        if changed_names:
+            raise ValueError(
+                f'Settings are already initialized, so {changed_names} '
+                "can't be changed!"
+            )
+
+    def _configure(
+        self,
+        *,
+        config_file: str,
+        log_file: str,
+        log_level: str,
+        test_mode: Optional[bool],
+    ) -> None:
+        """Set all settings of the single instance.
+
+        :param config_file: The name of the configuration file.
+        :param log_file: The name of the log file.
+        :param log_level: The logging level.
+        :param test_mode: Whether to run the predefined configuration.
+
+        """
+        self.base_dir: Path = _BASE_DIR
 
         config_file = config_file or os.environ.get(
             'AP_GAMES_CONFIGFILE', 'config.ini'
@@ -64,19 +149,62 @@ class Settings:
         ) else self.config_ini['test_mode']
 
     def read_config(self) -> None:
-        """Read the configuration from `config.ini` and set it."""
+        """Read the configuration from `config.ini` and set it.
+
+        :raises ValueError: if ``test_mode`` isn't a boolean value or
+            `config.ini` has a line that isn't parsed.
+
+        """
         if self.path_to_config_file.exists():
-            cfg = ConfigParser()
-            cfg.read_file(open(self.path_to_config_file))
-            log_level: str = cfg.get(
-                'ap-games', 'log_level', fallback='INFO'
-            ).upper()
+            cfg: Dict[str, str] = self._parse_section('ap-games')
+            log_level: str = cfg.get('log_level', 'INFO').upper()
             self.config_ini['log_level'] = (
                 log_level if log_level == 'DEBUG' else 'INFO'
             )
-            self.config_ini['log_file'] = cfg.get(
-                'ap-games', 'log_file', fallback='ap_games.log'
-            )
-            self.config_ini['test_mode'] = cfg.getboolean(
-                'ap-games', 'test_mode', fallback=False
+            self.config_ini['log_file'] = cfg.get('log_file', 'ap_games.log')
+            raw_test_mode: str = cfg.get('test_mode', 'false')
+            test_mode: Optional[bool] = _BOOLEAN_STATES.get(
+                raw_test_mode.lower()
             )
+            if test_mode is None:
+                raise ValueError(f'Not a boolean: {raw_test_mode}')
+            self.config_ini['test_mode'] = test_mode
+
+    def _parse_section(self, section: str) -> Dict[str, str]:
+        """Return options of the ``section`` from `config.ini`.
+
+        A tiny replacement of :class:`configparser.ConfigParser` that
+        supports only ``key = value`` and ``key: value`` lines, full-line
+        comments and section headers.  Options of the ``[DEFAULT]``
+        section are the default options of the ``section``.
+
+        :param section: name of the section to read.
+
+        :raises ValueError: if a line is neither an option, a comment
+            nor a section header.
+
+        :returns: Dictionary with lowercase keys and stripped values.
+
+        """
+        sections: Dict[str, Dict[str, str]] = {
+            _DEFAULT_SECTION: {},
+            section: {},
+        }
+        # options of other sections aren't returned
+        options: Dict[str, str] = {}
+        with self.path_to_config_file.open('rb') as config_file:
+            data: bytes = config_file.read()
+        for line in data.decode('utf-8').splitlines():
+            stripped_line: str = line.strip()
+            if not stripped_line or stripped_line[0] in '#;':
+                continue
+            section_match = _SECTION_RE.fullmatch(stripped_line)
+            if section_match:
+                options = sections.get(section_match.group(1), {})
+                continue
+            option_match = _KV_RE.fullmatch(stripped_line)
+            if not option_match:
+                raise ValueError(f'Not an option: {stripped_line}')
+            key, value = option_match.groups()
+            options[key.strip().lower()] = value.strip()
+        return {**sections[_DEFAULT_SECTION], **sections[section]}
@@ -11,28 +11,29 @@ from ap_games.gameboard.gameboard import SquareGameboard
 
 if TYPE_CHECKING:
     from typing import Any
+    from typing import FrozenSet
     from typing import Literal
 
 
-@pytest.fixture(
-    scope='session',
-    params=[
-        'get_status',
-        'place_mark',
-        'get_available_moves',
-        'get_score',
-        'default_grid',
-        'grid_axis',
-        'grid_gap',
-        'supported_players',
-        'rules',
-        'priority_coordinates',
-        'players',
-    ],
-    ids=lambda interface: f'{interface=}',
-)
-def reversi_interface(request: Any) -> str:
-    return cast(str, request.param)
+@pytest.fixture(scope='session')
+def reversi_interface() -> FrozenSet[str]:
+    return frozenset(
+        (
+            'get_status',
+            'place_mark',
+            'get_available_moves',
+            'get_available_indices',
+            'place_mark_at_index',
+            'get_score',
+            'default_grid',
+            'grid_axis',
+            'grid_gap',
+            'supported_players',
+            'rules',
+            'priority_coordinates',
+            'players',
+        )
+    )
 
 
 @pytest.fixture(scope='session')
@@ -70,19 +71,37 @@ def wrong_grid_symbol(request: Any) -> str:
     return cast(str, request.param)
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def reversi_user_user(default_gameboard_as_string: str) -> Reversi:
     """Return Reversi game with the default grid and two human players.
 
+    The game is shared between tests, so tests must not change its
+    gameboard.  Use :func:`new_reversi_user_user` instead.
+
     :param default_gameboard_as_string:  The start Reversi board as
         string.
 
     """
-    user: Literal['user'] = 'user'
-    return Reversi(grid=default_gameboard_as_string, player_types=(user, user))
+    return _create_reversi_user_user(default_gameboard_as_string)
 
 
 @pytest.fixture()
+def new_reversi_user_user(default_gameboard_as_string: str) -> Reversi:
+    """Return a new Reversi game that a test can change.
+
+    :param default_gameboard_as_string:  The start Reversi board as
+        string.
+
+    """
+    return _create_reversi_user_user(default_gameboard_as_string)
+
+
+def _create_reversi_user_user(grid: str) -> Reversi:
+    user: Literal['user'] = 'user'
+    return Reversi(grid=grid, player_types=(user, user))
+
+
+@pytest.fixture(scope='session')
 def reversi_gameboard(reversi_gameboard_as_string: str) -> SquareGameboard:
     return SquareGameboard(grid=reversi_gameboard_as_string)
 
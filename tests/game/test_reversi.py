@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 import pytest  # type: ignore
@@ -10,18 +11,22 @@ from ap_games.game.reversi import Reversi
 from ap_games.gameboard.gameboard import SquareGameboard
 
 if TYPE_CHECKING:
+    from typing import FrozenSet
     from typing import Literal
     from typing import Tuple
 
     from ap_games.ap_typing import Coordinates
     from ap_games.ap_typing import PlayerType
 
+_PLAYERS_NUMBER_RE = re.compile('number of players')
+_GRID_RE = re.compile('must contain')
+
 
 class TestReversi:
     def test_reversi_interface(
-        self, reversi_user_user: Reversi, reversi_interface: str
+        self, reversi_user_user: Reversi, reversi_interface: FrozenSet[str]
     ) -> None:
-        assert hasattr(reversi_user_user, reversi_interface)
+        assert reversi_interface <= set(dir(reversi_user_user))
 
     def test_gameboard(self, reversi_gameboard_as_string: str) -> None:
         assert (
@@ -41,7 +46,7 @@ class TestReversi:
     def test_wrong_players_number(self, wrong_players_number: int) -> None:
         user: PlayerType = 'user'
         player_types: Tuple[PlayerType, ...] = (user,) * wrong_players_number
-        with pytest.raises(ValueError, match='number of players') as e:
+        with pytest.raises(ValueError, match=_PLAYERS_NUMBER_RE) as e:
             Reversi(player_types=player_types)  # type: ignore
         assert 'The number of players should be 2!' == str(e.value)
 
@@ -58,7 +63,7 @@ class TestReversi:
         self, wrong_grid_symbol: str
     ) -> None:
         user: PlayerType = 'user'
-        with pytest.raises(ValueError, match='must contain') as e:
+        with pytest.raises(ValueError, match=_GRID_RE) as e:
             Reversi(grid=wrong_grid_symbol * 64, player_types=(user, user))
         assert (
             'Gameboard must contain only " ", "_" and symbols '
@@ -110,6 +115,50 @@ class TestReversi:
             gameboard, player_mark
         )
 
+    @pytest.mark.parametrize(
+        ('gameboard_grid', 'player_mark', 'available_indices'),
+        [
+            ('   OOOXXX', 'X', (0, 2, 1)),
+            ('   OXOXXX', 'X', (0, 2)),
+            ('   XXXOOO', 'X', ()),
+        ],
+        ids=lambda arg: f'{arg}',
+    )
+    def test_get_available_indices(
+        self,
+        gameboard_grid: str,
+        player_mark: Literal['X'],
+        available_indices: Tuple[int, ...],
+        reversi_user_user: Reversi,
+    ) -> None:
+        gameboard: SquareGameboard = SquareGameboard(grid=gameboard_grid)
+        assert available_indices == reversi_user_user.get_available_indices(
+            gameboard, player_mark
+        )
+
+    @pytest.mark.parametrize(
+        ('gameboard_grid', 'player_mark', 'enemy_mark', 'has_moves'),
+        [
+            ('   OOOXXX', 'X', 'O', True),
+            ('   XXXOOO', 'X', 'O', False),
+            ('XO OX  XO', 'O', 'X', True),
+            ('  XO     ', 'X', 'O', False),
+        ],
+        ids=lambda arg: f'{arg}',
+    )
+    def test_has_available_moves(
+        self,
+        gameboard_grid: str,
+        player_mark: Literal['X', 'O'],
+        enemy_mark: Literal['X', 'O'],
+        has_moves: bool,
+        reversi_user_user: Reversi,
+    ) -> None:
+        gameboard: SquareGameboard = SquareGameboard(grid=gameboard_grid)
+        assert has_moves is reversi_user_user._has_available_moves(
+            gameboard, player_mark, enemy_mark
+        )
+
     @pytest.mark.parametrize(
         ('gameboard_grid', 'player_mark', 'game_status'),
         [
@@ -180,27 +229,27 @@ class TestReversi:
         )
 
     def test_fill_available_moves_cache(
-        self, reversi_user_user: Reversi
+        self, new_reversi_user_user: Reversi
     ) -> None:
         coordinate: Coordinate = Coordinate(6, 5)
         player_mark: Literal['X'] = 'X'
 
-        grid: str = reversi_user_user.gameboard.grid_as_string
-        reversi_user_user.place_mark(
+        grid: str = new_reversi_user_user.gameboard.grid_as_string
+        new_reversi_user_user.place_mark(
             coordinate=coordinate,
             player_mark=player_mark,
             gameboard=SquareGameboard(grid=grid),
         )
         assert (
             [Coordinate(x=5, y=5)]
-            == reversi_user_user._available_moves_cache[grid, player_mark][
+            == new_reversi_user_user._available_moves_cache[grid, player_mark][
                 coordinate
             ]
         )
-        reversi_user_user.place_mark(
+        new_reversi_user_user.place_mark(
             coordinate=coordinate, player_mark=player_mark,
         )
         assert (
             grid,
             player_mark,
-        ) not in reversi_user_user._available_moves_cache
+        ) not in new_reversi_user_user._available_moves_cache
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest  # type: ignore
+
+from ap_games.ap_collections import GameStatus
+from ap_games.game.tictactoe import TicTacToe
+from ap_games.gameboard.gameboard import SquareGameboard
+
+if TYPE_CHECKING:
+    from ap_games.ap_typing import PlayerType
+
+
+class TestTicTacToe:
+    @pytest.mark.parametrize(
+        ('gameboard_grid', 'game_status'),
+        [
+            (
+                'XO XOX O ',
+                GameStatus(active=False, message='O wins\n', must_skip=False),
+            ),
+            (
+                'OXXXOXO O',
+                GameStatus(active=False, message='O wins\n', must_skip=False),
+            ),
+            (
+                'O XOX XO ',
+                GameStatus(active=False, message='X wins\n', must_skip=False),
+            ),
+            (
+                'XXXOO    ',
+                GameStatus(active=False, message='X wins\n', must_skip=False),
+            ),
+            (
+                'XOXXOOOXX',
+                GameStatus(active=False, message='Draw\n', must_skip=False),
+            ),
+            (
+                'XXXOOO   ',
+                GameStatus(
+                    active=False, message='Impossible\n', must_skip=False
+                ),
+            ),
+            (
+                'XX OO    ',
+                GameStatus(active=True, message='', must_skip=False),
+            ),
+        ],
+        ids=lambda arg: f'{arg}',
+    )
+    def test_get_status(
+        self, gameboard_grid: str, game_status: GameStatus
+    ) -> None:
+        user: PlayerType = 'user'
+        tictactoe: TicTacToe = TicTacToe(player_types=(user, user))
+        assert game_status == tictactoe.get_status(
+            SquareGameboard(grid=gameboard_grid)
+        )
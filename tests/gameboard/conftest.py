@@ -10,15 +10,16 @@ from ap_games.ap_collections import Coordinate
 from ap_games.ap_constants import EMPTY
 from ap_games.ap_constants import O_MARK
 from ap_games.ap_constants import X_MARK
-from ap_games.gameboard.gameboard import _GameboardRegistry
-from ap_games.gameboard.gameboard import SquareGameboard
 
 if TYPE_CHECKING:
     from typing import Any
-    from typing import List
+    from typing import Dict
+    from typing import FrozenSet
     from typing import Tuple
 
     from ap_games.ap_typing import Side
+    from ap_games.gameboard.gameboard import _GameboardRegistry
+    from ap_games.gameboard.gameboard import SquareGameboard
 
 
 @pytest.fixture(
@@ -33,27 +34,35 @@ def allowed_size(request: Any) -> int:
     return cast(int, request.param)
 
 
-@pytest.fixture(
-    scope='session',
-    params=[
-        'size',
-        'grid_as_string',
-        'columns',
-        'rows',
-        'diagonals',
-        'all_sides',
-        'cells',
-        'available_moves',
-        'place_mark',
-        'get_offset_cell',
-        'get_offsets',
-        'count',
-        'copy',
-    ],
-    ids=lambda interface: f'{interface=}',
-)
-def public_interface(request: Any) -> str:
-    return cast(str, request.param)
+@pytest.fixture(scope='session')
+def empty_grids() -> Dict[int, str]:
+    return {size: EMPTY * (size * size) for size in range(11)}
+
+
+@pytest.fixture(scope='session')
+def public_interface() -> FrozenSet[str]:
+    return frozenset(
+        (
+            'size',
+            'grid_as_string',
+            'columns',
+            'rows',
+            'diagonals',
+            'all_sides',
+            'cells',
+            'available_moves',
+            'available_indices',
+            'place_mark',
+            'place_mark_at_index',
+            'flip',
+            'restore',
+            'get_offset_cell',
+            'get_offsets',
+            'get_bitboard',
+            'count',
+            'copy',
+        )
+    )
 
 
 @pytest.fixture(
@@ -71,22 +80,28 @@ def gap_symbol(request: Any) -> str:
 
 
 @pytest.fixture(scope='session')
-def all_coordinates_2x2() -> List[Coordinate]:
-    return [
-        Coordinate(x=1, y=1),
-        Coordinate(x=1, y=2),
-        Coordinate(x=2, y=1),
-        Coordinate(x=2, y=2),
-    ]
+def all_coordinates_2x2() -> FrozenSet[Coordinate]:
+    return frozenset(
+        (
+            Coordinate(x=1, y=1),
+            Coordinate(x=1, y=2),
+            Coordinate(x=2, y=1),
+            Coordinate(x=2, y=2),
+        )
+    )
 
 
 @pytest.fixture(scope='session')
 def gameboard_registry_2x2() -> _GameboardRegistry:
+    from ap_games.gameboard.gameboard import _GameboardRegistry
+
     return _GameboardRegistry(size=2)
 
 
 @pytest.fixture(scope='session')
 def gameboard_registry_3x3() -> _GameboardRegistry:
+    from ap_games.gameboard.gameboard import _GameboardRegistry
+
     return _GameboardRegistry(size=3)
 
 
@@ -115,14 +130,14 @@ def cell_2_1_x() -> Cell:
     return Cell(coordinate=Coordinate(x=2, y=1), mark=X_MARK)
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def gameboard_2x2_cells(
     cell_1_2_empty: Cell, cell_2_2_o: Cell, cell_1_1_x: Cell, cell_2_1_x: Cell,
 ) -> Tuple[Cell, ...]:
     return cell_1_2_empty, cell_2_2_o, cell_1_1_x, cell_2_1_x
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def gameboard_2x2_columns(
     gameboard_2x2_cells: Tuple[Cell, ...]
 ) -> Tuple[Side, ...]:
@@ -132,7 +147,7 @@ def gameboard_2x2_columns(
     )
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def gameboard_2x2_rows(
     gameboard_2x2_cells: Tuple[Cell, ...]
 ) -> Tuple[Side, ...]:
@@ -142,7 +157,7 @@ def gameboard_2x2_rows(
     )
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def gameboard_2x2_diagonals(
     gameboard_2x2_cells: Tuple[Cell, ...]
 ) -> Tuple[Side, Side]:
@@ -152,22 +167,37 @@ def gameboard_2x2_diagonals(
     )
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def grid_2x2_as_string(gameboard_2x2_cells: Tuple[Cell, ...]) -> str:
-    return ''.join(cell.mark for cell in gameboard_2x2_cells)
+    top_left, top_right, bottom_left, bottom_right = gameboard_2x2_cells
+    return (
+        top_left.mark + top_right.mark + bottom_left.mark + bottom_right.mark
+    )
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def gameboard_2x2(grid_2x2_as_string: str) -> SquareGameboard:
+    """Return the gameboard shared by the tests that don't change it.
+
+    :param grid_2x2_as_string: The grid of the gameboard.
+
+    """
+    from ap_games.gameboard.gameboard import SquareGameboard
+
     return SquareGameboard(grid=grid_2x2_as_string)
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture()
+def new_gameboard_2x2(gameboard_2x2: SquareGameboard) -> SquareGameboard:
+    return gameboard_2x2.copy()
+
+
+@pytest.fixture(scope='session')
 def grid_3x3_as_string() -> str:
     return 'X O X O X'
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def grid_3x3_no_colorized() -> str:
     return (
         '  ---------\n'
@@ -179,6 +209,8 @@ def grid_3x3_no_colorized() -> str:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def gameboard_3x3_no_colorized(grid_3x3_as_string: str) -> SquareGameboard:
+    from ap_games.gameboard.gameboard import SquareGameboard
+
     return SquareGameboard(grid=grid_3x3_as_string, axis=True, colorized=False)
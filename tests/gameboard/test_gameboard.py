@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 import pytest  # type: ignore
@@ -13,6 +14,8 @@ from ap_games.gameboard.gameboard import _GameboardRegistry
 from ap_games.gameboard.gameboard import SquareGameboard
 
 if TYPE_CHECKING:
+    from typing import Dict
+    from typing import FrozenSet
     from typing import List
     from typing import Tuple
 
@@ -20,6 +23,18 @@ if TYPE_CHECKING:
     from ap_games.ap_typing import Mark
     from ap_games.ap_typing import Side
 
+_SIZE_RE = re.compile('between 2 and 9')
+_SQUARE_RE = re.compile('must be square')
+_CHARACTERS_RE = re.compile('must include characters')
+_RANGE_RE = re.compile('out of range!')
+
+# the coordinates are shared by all parametrized tests of this module
+_coordinates: Dict[Tuple[int, int], Coordinate] = {
+    (column, row): Coordinate(column, row)
+    for column in range(-1, 4)
+    for row in range(-1, 4)
+}
+
 
 class TestGameboardRegistry:
     @pytest.mark.parametrize('size', [2, 9], ids=lambda size: f'{size=}')
@@ -27,7 +42,7 @@ class TestGameboardRegistry:
         assert size == _GameboardRegistry(size=size).size
 
     def test_wrong_size(self, wrong_size: int) -> None:
-        with pytest.raises(ValueError, match='between 2 and 9') as e:
+        with pytest.raises(ValueError, match=_SIZE_RE) as e:
             _GameboardRegistry(size=wrong_size)
         assert 'The size of the gameboard must be between 2 and 9!' == str(
             e.value
@@ -36,12 +51,12 @@ class TestGameboardRegistry:
     @pytest.mark.parametrize(
         ('index', 'coordinate'),
         [
-            (0, Coordinate(x=1, y=2)),
-            (1, Coordinate(x=2, y=2)),
-            (2, Coordinate(x=1, y=1)),
-            (3, Coordinate(x=2, y=1)),
+            (0, _coordinates[1, 2]),
+            (1, _coordinates[2, 2]),
+            (2, _coordinates[1, 1]),
+            (3, _coordinates[2, 1]),
         ],
-        ids=lambda arg: f'{arg}',
+        ids=['i0_c12', 'i1_c22', 'i2_c11', 'i3_c21'],
     )
     def test_index_to_coordinate(
         self,
@@ -53,28 +68,94 @@ class TestGameboardRegistry:
 
     def test_all_coordinates(
         self,
-        all_coordinates_2x2: List[Coordinate],
+        all_coordinates_2x2: FrozenSet[Coordinate],
         gameboard_registry_2x2: _GameboardRegistry,
     ) -> None:
-        assert all_coordinates_2x2 == sorted(
+        assert all_coordinates_2x2 == set(
             gameboard_registry_2x2.all_coordinates
         )
 
+    def test_index_to_cells(
+        self, gameboard_registry_2x2: _GameboardRegistry
+    ) -> None:
+        cells = gameboard_registry_2x2.index_to_cells[2]
+        assert {ord(EMPTY), ord(X_MARK), ord(O_MARK)} == set(cells)
+        assert _coordinates[1, 1] == cells[ord(X_MARK)].coordinate
+        assert X_MARK == cells[ord(X_MARK)].mark
+
+    def test_rays(self, gameboard_registry_3x3: _GameboardRegistry) -> None:
+        grid: str = '012345678'
+        assert ['30', '42', '78'] == [
+            grid[ray.cells]
+            for ray in gameboard_registry_3x3.rays
+            if ray.start == 6
+        ]
+
+    def test_packed_side_masks(
+        self, gameboard_registry_2x2: _GameboardRegistry
+    ) -> None:
+        lane_width: int = 5
+        assert gameboard_registry_2x2.side_masks == tuple(
+            (gameboard_registry_2x2.packed_side_masks >> (lane_width * lane))
+            & 0b1111
+            for lane in range(6)
+        )
+        assert gameboard_registry_2x2.side_lane_guards == (
+            gameboard_registry_2x2.side_lanes << 4
+        )
+
+    def test_bit_shifts(
+        self, gameboard_registry_3x3: _GameboardRegistry
+    ) -> None:
+        assert (
+            (3, 0b111111111, 0b111111111),
+            (2, 0b110110110, 0b011011011),
+            (1, 0b011011011, 0b110110110),
+            (4, 0b011011011, 0b110110110),
+        ) == gameboard_registry_3x3.bit_shifts
+
+    def test_sides(self, gameboard_registry_2x2: _GameboardRegistry) -> None:
+        assert (
+            (2, 3),
+            (0, 1),
+            (0, 2),
+            (1, 3),
+            (0, 3),
+            (2, 1),
+        ) == gameboard_registry_2x2.sides
+
+    def test_side_masks(
+        self, gameboard_registry_2x2: _GameboardRegistry
+    ) -> None:
+        assert (
+            0b0011,
+            0b1100,
+            0b1010,
+            0b0101,
+            0b1001,
+            0b0110,
+        ) == gameboard_registry_2x2.side_masks
+
 
 class TestSquareGameboard:
     def test_gameboard_interface(
-        self, gameboard_2x2: SquareGameboard, public_interface: str
+        self, gameboard_2x2: SquareGameboard, public_interface: FrozenSet[str]
     ) -> None:
-        assert hasattr(gameboard_2x2, public_interface)
+        assert public_interface <= set(dir(gameboard_2x2))
 
-    def test_size(self, allowed_size: int) -> None:
+    def test_slots(self, gameboard_2x2: SquareGameboard) -> None:
+        assert not hasattr(gameboard_2x2, '__dict__')
+
+    def test_size(
+        self, allowed_size: int, empty_grids: Dict[int, str]
+    ) -> None:
         assert (
             allowed_size
-            == SquareGameboard(grid=EMPTY * (allowed_size ** 2))._size
+            == SquareGameboard(grid=empty_grids[allowed_size])._size
         )
 
     def test_not_square_board(self) -> None:
-        with pytest.raises(ValueError, match='must be square') as e:
+        with pytest.raises(ValueError, match=_SQUARE_RE) as e:
             SquareGameboard(grid=EMPTY * 5)
         assert 'The gameboard must be square (2^2 != 5)!' == str(e.value)
 
@@ -84,10 +165,12 @@ class TestSquareGameboard:
     def test_indent(self, indent_symbol: str) -> None:
         assert indent_symbol == SquareGameboard(indent=indent_symbol).indent
 
-    def test_registry_size(self, allowed_size: int) -> None:
+    def test_registry_size(
+        self, allowed_size: int, empty_grids: Dict[int, str]
+    ) -> None:
         assert (
             allowed_size
-            == SquareGameboard(grid=EMPTY * (allowed_size ** 2)).registry.size
+            == SquareGameboard(grid=empty_grids[allowed_size]).registry.size
         )
 
     def test_gap(self, gap_symbol: str) -> None:
@@ -101,7 +184,7 @@ class TestSquareGameboard:
 
     def test_inappropriate_character(self) -> None:
         character: str = 'A'
-        with pytest.raises(ValueError, match='must include characters') as e:
+        with pytest.raises(ValueError, match=_CHARACTERS_RE) as e:
             SquareGameboard(grid=character * 4)
         assert (
             'The "grid" must include characters from the set: '
@@ -122,6 +205,14 @@ class TestSquareGameboard:
     ) -> None:
         assert gameboard_2x2_cells == gameboard_2x2.cells
 
+    def test_cells_after_place_mark(
+        self, new_gameboard_2x2: SquareGameboard
+    ) -> None:
+        assert EMPTY == new_gameboard_2x2.cells[0].mark
+        new_gameboard_2x2.place_mark_at_index(0, O_MARK)
+        assert O_MARK == new_gameboard_2x2.cells[0].mark
+        assert O_MARK == new_gameboard_2x2.rows[1][0].mark
+
     def test_getitem(
         self,
         gameboard_2x2: SquareGameboard,
@@ -177,50 +268,80 @@ class TestSquareGameboard:
     ) -> None:
         assert (coordinate_1_2_empty,) == gameboard_2x2.available_moves
 
-    def test_place_mark_in_empty_cell(
-        self, gameboard_2x2: SquareGameboard, coordinate_1_2_empty: Coordinate
-    ) -> None:
-        assert 1 == gameboard_2x2.place_mark(
-            coordinate=coordinate_1_2_empty, mark=X_MARK
-        )
+    def test_available_indices(self, gameboard_2x2: SquareGameboard) -> None:
+        assert (0,) == gameboard_2x2.available_indices
 
     @pytest.mark.parametrize(
-        'coordinate',
-        [Coordinate(2, 2), Coordinate(1, 1), Coordinate(2, 1)],
-        ids=lambda coordinate: f'{coordinate=}',
+        ('index', 'force', 'expected_score'),
+        [(0, False, 1), (1, False, 0), (1, True, 1)],
+        ids=lambda arg: f'{arg}',
     )
-    def test_place_mark_in_occupied_cell(
-        self, gameboard_2x2: SquareGameboard, coordinate: Coordinate
+    def test_place_mark_at_index(
+        self,
+        new_gameboard_2x2: SquareGameboard,
+        index: int,
+        force: bool,
+        expected_score: int,
     ) -> None:
-        assert 0 == gameboard_2x2.place_mark(
-            coordinate=coordinate, mark=X_MARK
+        assert expected_score == new_gameboard_2x2.place_mark_at_index(
+            index, X_MARK, force=force
         )
 
     @pytest.mark.parametrize(
-        'coordinate',
+        ('coordinate', 'force', 'expected_score'),
         [
-            Coordinate(1, 2),
-            Coordinate(2, 2),
-            Coordinate(1, 1),
-            Coordinate(2, 1),
+            (_coordinates[1, 2], False, 1),
+            (_coordinates[2, 2], False, 0),
+            (_coordinates[1, 1], False, 0),
+            (_coordinates[2, 1], False, 0),
+            (_coordinates[1, 2], True, 1),
+            (_coordinates[2, 2], True, 1),
+            (_coordinates[1, 1], True, 1),
+            (_coordinates[2, 1], True, 1),
+        ],
+        ids=[
+            'c12',
+            'c22',
+            'c11',
+            'c21',
+            'c12_force',
+            'c22_force',
+            'c11_force',
+            'c21_force',
         ],
-        ids=lambda coordinate: f'{coordinate=}',
     )
-    def test_place_mark_force(
-        self, gameboard_2x2: SquareGameboard, coordinate: Coordinate
+    def test_place_mark(
+        self,
+        new_gameboard_2x2: SquareGameboard,
+        coordinate: Coordinate,
+        force: bool,
+        expected_score: int,
     ) -> None:
-        assert 1 == gameboard_2x2.place_mark(
-            coordinate=coordinate, mark=X_MARK, force=True
+        assert expected_score == new_gameboard_2x2.place_mark(
+            coordinate=coordinate, mark=X_MARK, force=force
         )
 
+    def test_flip(self, new_gameboard_2x2: SquareGameboard) -> None:
+        assert 2 == new_gameboard_2x2.flip(
+            (_coordinates[1, 2], _coordinates[2, 2]), X_MARK
+        )
+        assert X_MARK * 3 == new_gameboard_2x2.grid_as_string[:3]
+
+    def test_restore(self, new_gameboard_2x2: SquareGameboard) -> None:
+        grid: str = new_gameboard_2x2.grid_as_string
+        new_gameboard_2x2.place_mark_at_index(0, X_MARK)
+        new_gameboard_2x2.restore(grid)
+        assert grid == new_gameboard_2x2.grid_as_string
+        assert EMPTY == new_gameboard_2x2.cells[0].mark
+
     @pytest.mark.parametrize(
         ('coordinate', 'direction'),
         [
-            (Coordinate(1, 2), Coordinate(1, 0)),
-            (Coordinate(1, 1), Coordinate(1, 1)),
-            (Coordinate(2, 1), Coordinate(0, 1)),
+            (_coordinates[1, 2], _coordinates[1, 0]),
+            (_coordinates[1, 1], _coordinates[1, 1]),
+            (_coordinates[2, 1], _coordinates[0, 1]),
         ],
-        ids=lambda arg: f'{arg}',
+        ids=['c12_d10', 'c11_d11', 'c21_d01'],
     )
     def test_get_offset_cell(
         self,
@@ -237,25 +358,25 @@ class TestSquareGameboard:
         ('coordinate', 'offsets'),
         [
             (
-                Coordinate(x=1, y=1),
+                _coordinates[1, 1],
                 [
-                    Offset(Coordinate(x=1, y=2), Coordinate(x=0, y=1)),
-                    Offset(Coordinate(x=2, y=1), Coordinate(x=1, y=0)),
-                    Offset(Coordinate(x=2, y=2), Coordinate(x=1, y=1)),
+                    Offset(_coordinates[1, 2], _coordinates[0, 1]),
+                    Offset(_coordinates[2, 1], _coordinates[1, 0]),
+                    Offset(_coordinates[2, 2], _coordinates[1, 1]),
                 ],
             ),
             (
-                Coordinate(x=2, y=2),
+                _coordinates[2, 2],
                 [
-                    Offset(Coordinate(x=2, y=3), Coordinate(x=0, y=1),),
-                    Offset(Coordinate(x=3, y=1), Coordinate(x=1, y=-1),),
-                    Offset(Coordinate(x=3, y=2), Coordinate(x=1, y=0),),
-                    Offset(Coordinate(x=3, y=3), Coordinate(x=1, y=1),),
+                    Offset(_coordinates[2, 3], _coordinates[0, 1],),
+                    Offset(_coordinates[3, 1], _coordinates[1, -1],),
+                    Offset(_coordinates[3, 2], _coordinates[1, 0],),
+                    Offset(_coordinates[3, 3], _coordinates[1, 1],),
                 ],
             ),
-            (Coordinate(x=3, y=3), [],),
+            (_coordinates[3, 3], [],),
         ],
-        ids=lambda arg: f'{arg}',
+        ids=['c11', 'c22', 'c33'],
     )
     def test_get_offsets(
         self,
@@ -263,19 +384,19 @@ class TestSquareGameboard:
         offsets: List[Offset],
         gameboard_3x3_no_colorized: SquareGameboard,
     ) -> None:
-        assert offsets == sorted(
+        assert set(offsets) == set(
             gameboard_3x3_no_colorized.get_offsets(coordinate)
         )
 
     @pytest.mark.parametrize(
         'coordinate',
-        [Coordinate(0, 0), Coordinate(1, 3), Coordinate(3, 1)],
-        ids=lambda coordinate: f'{coordinate=}',
+        [_coordinates[0, 0], _coordinates[1, 3], _coordinates[3, 1]],
+        ids=['c00', 'c13', 'c31'],
     )
     def test_get_offsets_wrong_coordinate(
         self, gameboard_2x2: SquareGameboard, coordinate: Coordinate
     ) -> None:
-        with pytest.raises(ValueError, match='out of range!') as e:
+        with pytest.raises(ValueError, match=_RANGE_RE) as e:
             gameboard_2x2.get_offsets(coordinate=coordinate)
         assert f'The {coordinate} out of range!' == str(e.value)
 
@@ -287,6 +408,18 @@ class TestSquareGameboard:
     ) -> None:
         assert expected_count == gameboard_2x2.count(mark=mark)
 
+    @pytest.mark.parametrize(
+        ('expected_bitboard', 'mark'),
+        [(0b1000, EMPTY), (0b0100, O_MARK), (0b0011, X_MARK)],
+    )
+    def test_get_bitboard(
+        self,
+        gameboard_2x2: SquareGameboard,
+        expected_bitboard: int,
+        mark: Mark,
+    ) -> None:
+        assert expected_bitboard == gameboard_2x2.get_bitboard(mark)
+
     @pytest.mark.parametrize(
         'attr',
         ['grid_as_string', '_gap', '_axis'],
@@ -297,3 +430,10 @@ class TestSquareGameboard:
         assert getattr(gameboard_2x2, attr) == getattr(
             gameboard_2x2_copy, attr
         )
+
+    def test_copy_is_independent(self, gameboard_2x2: SquareGameboard) -> None:
+        gameboard_2x2_copy: SquareGameboard = gameboard_2x2.copy()
+        gameboard_2x2_copy.place_mark_at_index(0, X_MARK, force=True)
+        assert gameboard_2x2.grid_as_string != (
+            gameboard_2x2_copy.grid_as_string
+        )
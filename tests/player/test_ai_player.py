@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+import pytest  # type: ignore
+
+from ap_games.ap_collections import Coordinate
+from ap_games.game.tictactoe import TicTacToe
+from ap_games.player.ai_player import AIPlayer
+
+if TYPE_CHECKING:
+    from typing import Tuple
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+@pytest.mark.parametrize(
+    ('random_value', 'coordinate'),
+    [(0.0, Coordinate(x=2, y=2)), (0.99, Coordinate(x=3, y=1))],
+    ids=lambda arg: f'{arg}',
+)
+def test_move_with_cached_tree(
+    random_value: float, coordinate: Coordinate, monkeypatch: MonkeyPatch
+) -> None:
+    monkeypatch.setattr(random, 'random', lambda: random_value)
+    game: TicTacToe = TicTacToe(grid='_________')
+    player: AIPlayer = AIPlayer('nightmare', mark='X', game=game)
+    player.move()
+    game.place_mark(Coordinate(x=1, y=1), player_mark='X')
+    game.place_mark(Coordinate(x=1, y=2), player_mark='O')
+    assert coordinate == player.move()
+
+
+@pytest.mark.parametrize('random_value', [0.0, 0.99])
+@pytest.mark.parametrize(
+    'enemy_coordinates',
+    [
+        ((1, 2), (2, 3), (3, 3), (1, 3), (2, 1)),
+        ((3, 2), (1, 1), (2, 3), (3, 1), (1, 3)),
+    ],
+    ids=lambda arg: f'{arg}',
+)
+def test_moves_of_one_player(
+    random_value: float,
+    enemy_coordinates: Tuple[Tuple[int, int], ...],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    # the player keeps the tree cached by its previous moves
+    monkeypatch.setattr(random, 'random', lambda: random_value)
+    game: TicTacToe = TicTacToe(grid='_________')
+    player: AIPlayer = AIPlayer('nightmare', mark='X', game=game)
+    for x, y in enemy_coordinates:
+        coordinate: Coordinate = player.move()
+        assert coordinate == AIPlayer('nightmare', mark='X', game=game).move()
+        game.place_mark(coordinate, player_mark='X')
+        if not game.get_status().active:
+            break
+        enemy_coordinate: Coordinate = Coordinate(x=x, y=y)
+        if enemy_coordinate not in game.get_available_moves():
+            enemy_coordinate = game.get_available_moves()[0]
+        game.place_mark(enemy_coordinate, player_mark='O')
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import random
+from typing import TYPE_CHECKING
+
+import pytest  # type: ignore
+
 from ap_games.ap_collections import Coordinate
+from ap_games.ap_constants import UNDEFINED_COORDINATE
 from ap_games.game.game_base import TwoPlayerBoardGame
 from ap_games.player.player import Player
 
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+
 
 def test_construction(player_user_x: Player) -> None:
     assert player_user_x
@@ -19,3 +28,26 @@ def test_mark(player_user_x: Player) -> None:
 
 def test_move(player_user_x: Player) -> None:
     assert Coordinate(x=1, y=1) == player_user_x.move()
+
+
+@pytest.mark.parametrize(
+    ('random_value', 'coordinate'),
+    [(0.0, Coordinate(x=1, y=2)), (0.99, Coordinate(x=2, y=1))],
+    ids=lambda arg: f'{arg}',
+)
+def test_random_coordinate(
+    random_value: float, coordinate: Coordinate, monkeypatch: MonkeyPatch
+) -> None:
+    monkeypatch.setattr(random, 'random', lambda: random_value)
+    game: TwoPlayerBoardGame = TwoPlayerBoardGame(grid='    ')
+    assert coordinate == Player('user', mark='X', game=game).move()
+
+
+def test_move_without_available_moves() -> None:
+    game: TwoPlayerBoardGame = TwoPlayerBoardGame(grid='XOOX')
+    player: Player = Player('user', mark='X', game=game)
+    assert UNDEFINED_COORDINATE == player.move()
+
+
+def test_slots(player_user_x: Player) -> None:
+    assert not hasattr(player_user_x, '__dict__')
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest  # type: ignore
+
+from ap_games.settings import Settings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+    from typing import Dict
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+@pytest.fixture
+def settings(tmp_path: Path, monkeypatch: MonkeyPatch) -> Settings:
+    settings: Settings = Settings()
+    monkeypatch.setattr(
+        settings, 'path_to_config_file', tmp_path / 'config.ini'
+    )
+    monkeypatch.setattr(settings, 'config_ini', {})
+    return settings
+
+
+@pytest.mark.parametrize(
+    'config',
+    [
+        '[ap-games]\ntest_mode = yes\nlog_level = DEBUG\nlog_file = a.log\n',
+        '[ap-games]\ntest_mode: yes\nlog_level: DEBUG\nlog_file: a.log\n',
+        '[DEFAULT]\ntest_mode = yes\nlog_file = b.log\n'
+        '[ap-games]\nlog_level = DEBUG\nlog_file = a.log\n',
+    ],
+    ids=('equal sign', 'colon', 'default section'),
+)
+def test_read_config(settings: Settings, config: str) -> None:
+    settings.path_to_config_file.write_text(config)
+    settings.read_config()
+    assert {
+        'log_level': 'DEBUG',
+        'log_file': 'a.log',
+        'test_mode': True,
+    } == settings.config_ini
+
+
+def test_read_config_with_other_section(settings: Settings) -> None:
+    settings.path_to_config_file.write_text(
+        '[other]\ntest_mode = yes\n[ap-games]\n# log_level = DEBUG\n'
+    )
+    settings.read_config()
+    assert {
+        'log_level': 'INFO',
+        'log_file': 'ap_games.log',
+        'test_mode': False,
+    } == settings.config_ini
+
+
+@pytest.mark.parametrize(
+    'config',
+    ['[ap-games]\ntest_mode\n', '[ap-games]\ntest_mode = maybe\n'],
+    ids=('no value', 'not a boolean'),
+)
+def test_read_config_with_invalid_line(
+    settings: Settings, config: str
+) -> None:
+    settings.path_to_config_file.write_text(config)
+    with pytest.raises(ValueError):
+        settings.read_config()
+
+
+def test_singleton() -> None:
+    assert Settings() is Settings()
+
+
+@pytest.mark.parametrize(
+    'arguments',
+    [{'log_level': 'DEBUG'}, {'test_mode': True}, {'log_file': 'a.log'}],
+    ids=lambda arguments: f'{arguments}',
+)
+def test_changed_arguments(arguments: Dict[str, Any]) -> None:
+    Settings()
+    with pytest.raises(ValueError, match='already initialized'):
+        Settings(**arguments)